@@ -14,6 +14,7 @@ from gslides_api.agnostic.ir import (
     FormattedTextRun,
 )
 from gslides_api.agnostic.text import (
+    MONOSPACE_FONTS,
     AbstractColor,
     BaselineOffset,
     FullTextStyle,
@@ -38,26 +39,13 @@ from gslides_api.domain.text import (
 )
 
 
-# Monospace font families for code detection
-MONOSPACE_FONTS = {
-    "courier new",
-    "courier",
-    "monospace",
-    "consolas",
-    "monaco",
-    "lucida console",
-    "dejavu sans mono",
-    "source code pro",
-    "fira code",
-    "jetbrains mono",
-}
-
-
 def _is_monospace(font_family: Optional[str]) -> bool:
     """Check if a font family is a monospace font."""
     if not font_family:
         return False
-    return font_family.lower() in MONOSPACE_FONTS
+    # Font names are matched ASCII case-insensitively; try the exact string
+    # first so already-lowercase names don't pay for a .lower() copy
+    return font_family in MONOSPACE_FONTS or font_family.lower() in MONOSPACE_FONTS
 
 
 def _dimension_to_pt(dimension: Optional[Dimension]) -> Optional[float]:
@@ -65,13 +53,12 @@ def _dimension_to_pt(dimension: Optional[Dimension]) -> Optional[float]:
     if dimension is None:
         return None
 
-    if dimension.unit == Unit.PT:
-        return dimension.magnitude
-    elif dimension.unit == Unit.EMU:
+    # The API reports font sizes in EMU almost always, so test that first
+    unit = dimension.unit
+    if unit is Unit.EMU:
         return dimension.magnitude / EMU_PER_PT
-    else:
-        # UNIT_UNSPECIFIED or unknown - assume points
-        return dimension.magnitude
+    # PT, UNIT_UNSPECIFIED or unknown - already (assumed to be) points
+    return dimension.magnitude
 
 
 def _pt_to_dimension(pt: Optional[float]) -> Optional[Dimension]:
@@ -81,12 +68,27 @@ def _pt_to_dimension(pt: Optional[float]) -> Optional[Dimension]:
     return Dimension(magnitude=pt, unit=Unit.PT)
 
 
-def _optional_color_to_abstract(opt_color: Optional[OptionalColor]) -> Optional[AbstractColor]:
+def _interned_color(key: object, cache: Optional[dict], **fields) -> AbstractColor:
+    """Return the AbstractColor for `key` from the per-conversion cache, creating it on a miss."""
+    if cache is None:
+        # Fields come straight from validated GSlides models, so skip revalidation
+        return AbstractColor.model_construct(**fields)
+    cache_key = ("color", key)
+    color = cache.get(cache_key)
+    if color is None:
+        color = cache[cache_key] = AbstractColor.model_construct(**fields)
+    return color
+
+
+def _optional_color_to_abstract(
+    opt_color: Optional[OptionalColor], cache: Optional[dict] = None
+) -> Optional[AbstractColor]:
     """Convert GSlides OptionalColor to AbstractColor.
 
     Handles both RGB colors and theme colors. Theme colors (e.g., LIGHT1, DARK1)
     are preserved in the AbstractColor.theme_color field so they can be
-    converted back without loss.
+    converted back without loss. Equal colors converted with the same
+    per-conversion cache share one instance.
     """
     if opt_color is None or opt_color.opaqueColor is None:
         return None
@@ -95,18 +97,18 @@ def _optional_color_to_abstract(opt_color: Optional[OptionalColor]) -> Optional[
 
     # Check for theme color first - this takes precedence
     if color.themeColor is not None:
-        return AbstractColor(theme_color=color.themeColor.value)
+        theme_color = color.themeColor.value
+        return _interned_color(theme_color, cache, theme_color=theme_color)
 
     # Fall back to RGB color
     if color.rgbColor is None:
         return None
 
     rgb = color.rgbColor
-    return AbstractColor(
-        red=rgb.red if rgb.red is not None else 0.0,
-        green=rgb.green if rgb.green is not None else 0.0,
-        blue=rgb.blue if rgb.blue is not None else 0.0,
-    )
+    red = rgb.red if rgb.red is not None else 0.0
+    green = rgb.green if rgb.green is not None else 0.0
+    blue = rgb.blue if rgb.blue is not None else 0.0
+    return _interned_color((red, green, blue), cache, red=red, green=green, blue=blue)
 
 
 def _abstract_to_optional_color(abstract_color: Optional[AbstractColor]) -> Optional[OptionalColor]:
@@ -139,43 +141,109 @@ def _abstract_to_optional_color(abstract_color: Optional[AbstractColor]) -> Opti
     )
 
 
+_BASELINE_TO_ABSTRACT = {
+    GSlidesBaselineOffset.SUPERSCRIPT: BaselineOffset.SUPERSCRIPT,
+    GSlidesBaselineOffset.SUBSCRIPT: BaselineOffset.SUBSCRIPT,
+}
+
+# NONE (and anything unmapped) means no explicit offset
+_BASELINE_TO_GSLIDES = {
+    BaselineOffset.SUPERSCRIPT: GSlidesBaselineOffset.SUPERSCRIPT,
+    BaselineOffset.SUBSCRIPT: GSlidesBaselineOffset.SUBSCRIPT,
+}
+
+
 def _convert_baseline_to_abstract(baseline: Optional[GSlidesBaselineOffset]) -> BaselineOffset:
     """Convert GSlides BaselineOffset to abstract BaselineOffset."""
-    if baseline is None:
-        return BaselineOffset.NONE
-
-    if baseline == GSlidesBaselineOffset.SUPERSCRIPT:
-        return BaselineOffset.SUPERSCRIPT
-    elif baseline == GSlidesBaselineOffset.SUBSCRIPT:
-        return BaselineOffset.SUBSCRIPT
-    else:
-        return BaselineOffset.NONE
+    return _BASELINE_TO_ABSTRACT.get(baseline, BaselineOffset.NONE)
 
 
 def _convert_baseline_to_gslides(baseline: BaselineOffset) -> Optional[GSlidesBaselineOffset]:
     """Convert abstract BaselineOffset to GSlides BaselineOffset."""
-    if baseline == BaselineOffset.SUPERSCRIPT:
-        return GSlidesBaselineOffset.SUPERSCRIPT
-    elif baseline == BaselineOffset.SUBSCRIPT:
-        return GSlidesBaselineOffset.SUBSCRIPT
-    else:
-        return None  # NONE means no explicit offset
+    return _BASELINE_TO_GSLIDES.get(baseline)
+
+
+def _optional_color_key(opt_color: Optional[OptionalColor]) -> Optional[tuple]:
+    """Hashable summary of the parts of an OptionalColor that affect conversion."""
+    if opt_color is None or opt_color.opaqueColor is None:
+        return None
+    color = opt_color.opaqueColor
+    if color.themeColor is not None:
+        return (color.themeColor,)
+    rgb = color.rgbColor
+    if rgb is None:
+        return None
+    return (rgb.red, rgb.green, rgb.blue)
 
 
-def gslides_style_to_full(style: Optional[TextStyle]) -> FullTextStyle:
+def _text_style_key(style: TextStyle) -> tuple:
+    """Hashable key covering every TextStyle field read by gslides_style_to_full.
+
+    The fields that only feed RichStyle are kept contiguous, see _RICH_KEY.
+    """
+    font_size = style.fontSize
+    return (
+        style.bold,
+        style.italic,
+        style.strikethrough,
+        # RichStyle inputs start here
+        style.underline,
+        style.smallCaps,
+        style.fontFamily,
+        (font_size.magnitude, font_size.unit) if font_size is not None else None,
+        style.weightedFontFamily.weight if style.weightedFontFamily else None,
+        _optional_color_key(style.foregroundColor),
+        _optional_color_key(style.backgroundColor),
+        style.baselineOffset,
+        # RichStyle inputs end here
+        style.link.url if style.link else None,
+    )
+
+
+# The part of a _text_style_key() that determines the RichStyle
+_RICH_KEY = slice(3, 11)
+
+
+def gslides_style_to_full(
+    style: Optional[TextStyle], cache: Optional[dict] = None
+) -> FullTextStyle:
     """Convert GSlides TextStyle to FullTextStyle (both markdown and rich parts).
 
     Args:
         style: GSlides TextStyle object, or None
+        cache: Optional dict scoped to one conversion (e.g. one list of text
+            elements). Equivalent styles converted with the same dict share one
+            FullTextStyle instance; without it every call returns a new one.
 
     Returns:
         FullTextStyle with both markdown-renderable and rich properties
     """
+    # Within one cache, runs without a TextStyle share a default stored under None
+    key = _text_style_key(style) if style is not None else None
+    if cache is None:
+        return _gslides_style_to_full_uncached(style, key, None)
+    full = cache.get(key)
+    if full is None:
+        full = cache[key] = _gslides_style_to_full_uncached(style, key, cache)
+    return full
+
+
+def _gslides_style_to_full_uncached(
+    style: Optional[TextStyle], key: Optional[tuple], cache: Optional[dict]
+) -> FullTextStyle:
+    """Build a fresh FullTextStyle from a GSlides TextStyle, or a default one for None.
+
+    Uses model_construct to skip validation: every value below is already of
+    the declared field type, since it comes from a validated TextStyle.
+    The RichStyle part is interned in the per-conversion cache, if given, so
+    styles differing only in markdown properties (e.g. bold vs. plain) share
+    a single RichStyle instance within one conversion.
+    """
     if style is None:
         return FullTextStyle()
 
     # Extract markdown-renderable properties
-    markdown = MarkdownRenderableStyle(
+    markdown = MarkdownRenderableStyle.model_construct(
         bold=style.bold or False,
         italic=style.italic or False,
         strikethrough=style.strikethrough or False,
@@ -184,21 +252,32 @@ def gslides_style_to_full(style: Optional[TextStyle]) -> FullTextStyle:
     )
 
     # Extract rich properties (non-markdown-renderable)
-    rich = RichStyle(
+    if cache is None:
+        rich = _rich_style_from_gslides(style, None)
+    else:
+        rich_key = ("rich", key[_RICH_KEY])
+        rich = cache.get(rich_key)
+        if rich is None:
+            rich = cache[rich_key] = _rich_style_from_gslides(style, cache)
+
+    return FullTextStyle.model_construct(markdown=markdown, rich=rich)
+
+
+def _rich_style_from_gslides(style: TextStyle, cache: Optional[dict]) -> RichStyle:
+    """Build the RichStyle (non-markdown-renderable) part of a GSlides TextStyle."""
+    return RichStyle.model_construct(
         font_family=style.fontFamily,
         font_size_pt=_dimension_to_pt(style.fontSize),
         font_weight=style.weightedFontFamily.weight if style.weightedFontFamily else None,
-        foreground_color=_optional_color_to_abstract(style.foregroundColor),
-        background_color=_optional_color_to_abstract(style.backgroundColor),
+        foreground_color=_optional_color_to_abstract(style.foregroundColor, cache),
+        background_color=_optional_color_to_abstract(style.backgroundColor, cache),
         underline=style.underline or False,
         small_caps=style.smallCaps or False,
         baseline_offset=_convert_baseline_to_abstract(style.baselineOffset),
     )
 
-    return FullTextStyle(markdown=markdown, rich=rich)
 
-
-def gslides_style_to_rich(style: Optional[TextStyle]) -> RichStyle:
+def gslides_style_to_rich(style: Optional[TextStyle], cache: Optional[dict] = None) -> RichStyle:
     """Extract only RichStyle from GSlides TextStyle.
 
     This is used by the styles() method to get only the non-markdown-renderable
@@ -206,11 +285,45 @@ def gslides_style_to_rich(style: Optional[TextStyle]) -> RichStyle:
 
     Args:
         style: GSlides TextStyle object, or None
+        cache: Optional per-conversion dict, as for gslides_style_to_full
 
     Returns:
         RichStyle with only non-markdown-renderable properties
     """
-    return gslides_style_to_full(style).rich
+    return gslides_style_to_full(style, cache).rich
+
+
+# What markdown_style_to_gslides / rich_style_to_gslides build for plain styles,
+# including which fields are explicitly set (to None), so TextStyle.is_default()
+# sees the same style
+_PLAIN_MARKDOWN_TEXT_STYLE = TextStyle(
+    bold=None, italic=None, strikethrough=None, fontFamily=None, link=None
+)
+_PLAIN_FULL_TEXT_STYLE = TextStyle(
+    bold=None,
+    italic=None,
+    strikethrough=None,
+    underline=None,
+    smallCaps=None,
+    fontFamily=None,
+    fontSize=None,
+    weightedFontFamily=None,
+    foregroundColor=None,
+    backgroundColor=None,
+    baselineOffset=None,
+    link=None,
+)
+
+
+def _is_plain_markdown(markdown: MarkdownRenderableStyle) -> bool:
+    """Check if a MarkdownRenderableStyle carries no formatting at all."""
+    return not (
+        markdown.bold
+        or markdown.italic
+        or markdown.strikethrough
+        or markdown.is_code
+        or markdown.hyperlink
+    )
 
 
 def full_style_to_gslides(style: FullTextStyle) -> TextStyle:
@@ -243,6 +356,11 @@ def rich_style_to_gslides(
     Returns:
         GSlides TextStyle object ready for API requests
     """
+    # Most runs carry no styling at all; copying the template (which keeps its
+    # fields_set) skips building and validating twelve None fields
+    if rich.is_default() and (markdown is None or _is_plain_markdown(markdown)):
+        return _PLAIN_FULL_TEXT_STYLE.model_copy()
+
     # Start with markdown-renderable properties
     bold = markdown.bold if markdown else None
     italic = markdown.italic if markdown else None
@@ -294,6 +412,11 @@ def markdown_style_to_gslides(markdown: MarkdownRenderableStyle) -> TextStyle:
     Returns:
         GSlides TextStyle with only markdown-derivable properties
     """
+    # Plain text is by far the most common case; copying the template (which
+    # keeps its fields_set) skips validating five None fields
+    if _is_plain_markdown(markdown):
+        return _PLAIN_MARKDOWN_TEXT_STYLE.model_copy()
+
     link = None
     if markdown.hyperlink:
         link = Link(url=markdown.hyperlink)
@@ -334,6 +457,12 @@ def text_elements_to_ir(elements: List[TextElement]) -> FormattedDocument:
     if not elements:
         return FormattedDocument()
 
+    # Runs with equivalent styles share one FullTextStyle within this document only
+    style_cache: dict = {}
+
+    # Runs and paragraphs are built with model_construct: contents and styles come
+    # from already-validated TextElements, and the run lists are never mutated
+    # after being handed over (they are rebound, not cleared)
     result_elements = []
     current_paragraph_runs = []
 
@@ -359,7 +488,7 @@ def text_elements_to_ir(elements: List[TextElement]) -> FormattedDocument:
                 # Regular paragraph marker - no bullet
                 # Flush any pending list item
                 if in_list_item and current_list_item_runs and current_list is not None:
-                    item_para = FormattedParagraph(runs=current_list_item_runs)
+                    item_para = FormattedParagraph.model_construct(runs=current_list_item_runs)
                     list_item = FormattedListItem(
                         paragraphs=[item_para],
                         nesting_level=current_item_nesting_level,
@@ -374,7 +503,7 @@ def text_elements_to_ir(elements: List[TextElement]) -> FormattedDocument:
         # Handle text runs
         if te.textRun is not None:
             content = te.textRun.content
-            style = gslides_style_to_full(te.textRun.style)
+            style = gslides_style_to_full(te.textRun.style, style_cache)
 
             # Check if we're starting a new bullet item
             if pending_bullet_info is not None:
@@ -384,7 +513,7 @@ def text_elements_to_ir(elements: List[TextElement]) -> FormattedDocument:
                 if current_list is None or current_list.ordered != is_ordered:
                     # Flush any pending paragraph
                     if current_paragraph_runs:
-                        para = FormattedParagraph(runs=current_paragraph_runs)
+                        para = FormattedParagraph.model_construct(runs=current_paragraph_runs)
                         result_elements.append(para)
                         current_paragraph_runs = []
 
@@ -405,12 +534,12 @@ def text_elements_to_ir(elements: List[TextElement]) -> FormattedDocument:
                 item_content = content.rstrip("\n")
 
                 if item_content:
-                    item_run = FormattedTextRun(content=item_content, style=style)
+                    item_run = FormattedTextRun.model_construct(content=item_content, style=style)
                     current_list_item_runs.append(item_run)
 
                 # If content ends with newline, complete this list item
                 if has_newline and current_list_item_runs:
-                    item_para = FormattedParagraph(runs=current_list_item_runs)
+                    item_para = FormattedParagraph.model_construct(runs=current_list_item_runs)
                     list_item = FormattedListItem(
                         paragraphs=[item_para],
                         nesting_level=nesting_level,
@@ -426,13 +555,13 @@ def text_elements_to_ir(elements: List[TextElement]) -> FormattedDocument:
                 item_content = content.rstrip("\n")
 
                 if item_content:
-                    item_run = FormattedTextRun(content=item_content, style=style)
+                    item_run = FormattedTextRun.model_construct(content=item_content, style=style)
                     current_list_item_runs.append(item_run)
 
                 # If content ends with newline, complete this list item
                 if has_newline and current_list_item_runs and current_list is not None:
                     # Use the nesting level from when the item started
-                    item_para = FormattedParagraph(runs=current_list_item_runs)
+                    item_para = FormattedParagraph.model_construct(runs=current_list_item_runs)
                     list_item = FormattedListItem(
                         paragraphs=[item_para],
                         nesting_level=current_item_nesting_level,
@@ -446,7 +575,7 @@ def text_elements_to_ir(elements: List[TextElement]) -> FormattedDocument:
                 if current_list is not None:
                     # Flush any remaining list item runs
                     if current_list_item_runs:
-                        item_para = FormattedParagraph(runs=current_list_item_runs)
+                        item_para = FormattedParagraph.model_construct(runs=current_list_item_runs)
                         list_item = FormattedListItem(paragraphs=[item_para], nesting_level=current_item_nesting_level)
                         current_list.items.append(list_item)
                         current_list_item_runs = []
@@ -455,7 +584,7 @@ def text_elements_to_ir(elements: List[TextElement]) -> FormattedDocument:
                     in_list_item = False
 
                 # Create the formatted run
-                run = FormattedTextRun(content=content, style=style)
+                run = FormattedTextRun.model_construct(content=content, style=style)
 
                 # Add the run to the current paragraph
                 current_paragraph_runs.append(run)
@@ -463,7 +592,7 @@ def text_elements_to_ir(elements: List[TextElement]) -> FormattedDocument:
                 # Handle line breaks - if content ends with newline, complete the paragraph
                 if "\n" in content:
                     # Create paragraph from accumulated runs
-                    para = FormattedParagraph(runs=current_paragraph_runs)
+                    para = FormattedParagraph.model_construct(runs=current_paragraph_runs)
                     result_elements.append(para)
                     current_paragraph_runs = []
 
@@ -471,12 +600,12 @@ def text_elements_to_ir(elements: List[TextElement]) -> FormattedDocument:
     if current_list is not None:
         # Flush any remaining list item runs
         if current_list_item_runs:
-            item_para = FormattedParagraph(runs=current_list_item_runs)
+            item_para = FormattedParagraph.model_construct(runs=current_list_item_runs)
             list_item = FormattedListItem(paragraphs=[item_para], nesting_level=current_item_nesting_level)
             current_list.items.append(list_item)
         result_elements.append(current_list)
     if current_paragraph_runs:
-        para = FormattedParagraph(runs=current_paragraph_runs)
+        para = FormattedParagraph.model_construct(runs=current_paragraph_runs)
         result_elements.append(para)
 
     return FormattedDocument(elements=result_elements)
@@ -7,7 +7,6 @@ handling:
 3. Support for lists, paragraphs, and various text formatting
 """
 
-import copy
 from typing import List, Optional
 
 from gslides_api.agnostic.ir import (
@@ -42,7 +41,7 @@ def ir_to_markdown(doc: FormattedDocument) -> str:
             list_lines = _list_to_markdown(element)
             result_lines.extend(list_lines)
 
-    return "\n".join(result_lines).rstrip() if result_lines else ""
+    return _join_and_rstrip(result_lines, "\n")
 
 
 def _paragraph_to_markdown(para: FormattedParagraph) -> Optional[str]:
@@ -66,10 +65,18 @@ def _paragraph_to_markdown(para: FormattedParagraph) -> Optional[str]:
         formatted = _format_run_to_markdown(run.content, run.style)
         parts.append(formatted)
 
-    result = "".join(parts).rstrip()
+    result = _join_and_rstrip(parts, "")
     return result if result else None
 
 
+def _join_and_rstrip(parts: List[str], separator: str) -> str:
+    """Join parts and strip trailing whitespace, skipping the strip when there is none."""
+    result = separator.join(parts)
+    if result and result[-1].isspace():
+        return result.rstrip()
+    return result
+
+
 def _list_to_markdown(list_element: FormattedList) -> List[str]:
     """Convert a list to markdown lines.
 
@@ -130,14 +137,17 @@ def _consolidate_runs(runs: List[FormattedTextRun]) -> List[FormattedTextRun]:
     if not runs:
         return []
 
+    # Styles are only read while formatting, so merged runs can share them
     result = []
     current = FormattedTextRun(
         content=runs[0].content,
-        style=copy.deepcopy(runs[0].style),
+        style=runs[0].style,
     )
+    current_key = _markdown_style_key(runs[0].style.markdown)
 
     for run in runs[1:]:
-        if _same_markdown_style(current.style.markdown, run.style.markdown):
+        key = _markdown_style_key(run.style.markdown)
+        if key == current_key:
             # Same formatting - merge content
             current.content += run.content
         else:
@@ -145,34 +155,29 @@ def _consolidate_runs(runs: List[FormattedTextRun]) -> List[FormattedTextRun]:
             result.append(current)
             current = FormattedTextRun(
                 content=run.content,
-                style=copy.deepcopy(run.style),
+                style=run.style,
             )
+            current_key = key
 
     # Don't forget the last run
     result.append(current)
     return result
 
 
-def _same_markdown_style(a: MarkdownRenderableStyle, b: MarkdownRenderableStyle) -> bool:
-    """Check if two markdown styles are identical for consolidation purposes.
+def _markdown_style_key(style: MarkdownRenderableStyle) -> tuple[int, Optional[str]]:
+    """Pack the fields that matter for consolidation into one comparable key.
 
     Args:
-        a: First style
-        b: Second style
+        style: The markdown style to summarize
 
     Returns:
-        True if styles are identical
+        Tuple of (flag bits, hyperlink); equal keys mean identical markdown formatting
     """
-    return (
-        a.bold == b.bold
-        and a.italic == b.italic
-        and a.strikethrough == b.strikethrough
-        and a.hyperlink == b.hyperlink
-        and a.is_code == b.is_code
-    )
+    flags = style.bold << 3 | style.italic << 2 | style.strikethrough << 1 | style.is_code
+    return flags, style.hyperlink
 
 
-def _extract_whitespace_parts(content: str) -> tuple:
+def _extract_whitespace_parts(content: str) -> tuple[str, str, str, str]:
     """Extract leading spaces, inner text, trailing spaces, and trailing newlines.
 
     This helper ensures consistent whitespace handling across all formatting types
@@ -184,27 +189,44 @@ def _extract_whitespace_parts(content: str) -> tuple:
     Returns:
         Tuple of (leading_space, text_content, trailing_space, trailing_newlines)
     """
-    leading_space = ""
-    for char in content:
-        if char in " \t":
-            leading_space += char
-        else:
-            break
-
+    # Compute the boundaries with C-level strip calls instead of scanning in Python
+    lead = len(content) - len(content.lstrip(" \t"))
     temp_content = content.rstrip("\n")
-    trailing_newlines = content[len(temp_content):]
+    end = len(temp_content.rstrip(" \t"))
 
-    trailing_space = ""
-    for char in reversed(temp_content):
-        if char in " \t":
-            trailing_space = char + trailing_space
-        else:
-            break
-
-    text_content = content.strip(" \t").rstrip("\n")
+    leading_space = content[:lead]
+    text_content = temp_content[lead:end]
+    trailing_space = temp_content[end:]
+    trailing_newlines = content[len(temp_content) :]
     return leading_space, text_content, trailing_space, trailing_newlines
 
 
+def _emphasis_markers(bold: bool, italic: bool, strikethrough: bool) -> tuple[str, str]:
+    """Return the (prefix, suffix) markdown markers for a combination of flags.
+
+    Strikethrough is innermost, wrapped by `***` (bold + italic), `**` or `*`.
+    """
+    if bold and italic:
+        outer = "***"
+    elif bold:
+        outer = "**"
+    elif italic:
+        outer = "*"
+    else:
+        outer = ""
+    inner = "~~" if strikethrough else ""
+    return outer + inner, inner + outer
+
+
+# (bold, italic, strikethrough) -> (prefix, suffix), precomputed for all combinations
+_EMPHASIS_MARKERS = {
+    (bold, italic, strikethrough): _emphasis_markers(bold, italic, strikethrough)
+    for bold in (False, True)
+    for italic in (False, True)
+    for strikethrough in (False, True)
+}
+
+
 def _format_run_to_markdown(content: str, style: FullTextStyle) -> str:
     """Apply markdown formatting to content, moving spaces outside markers.
 
@@ -224,11 +246,16 @@ def _format_run_to_markdown(content: str, style: FullTextStyle) -> str:
     md = style.markdown
 
     # Don't apply formatting markers to whitespace-only content
-    if not content.strip(" \t\n"):
+    stripped = content.strip(" \t\n")
+    if not stripped:
         return content
 
-    # Extract whitespace parts once for all formatting types
-    leading, text, trailing, newlines = _extract_whitespace_parts(content)
+    # Extract whitespace parts once for all formatting types; most runs have no
+    # surrounding whitespace, in which case the strip above already tells us so
+    if len(stripped) == len(content):
+        leading, text, trailing, newlines = "", content, "", ""
+    else:
+        leading, text, trailing, newlines = _extract_whitespace_parts(content)
 
     # Handle hyperlinks first (they take precedence)
     if md.hyperlink:
@@ -244,19 +271,8 @@ def _format_run_to_markdown(content: str, style: FullTextStyle) -> str:
 
     # Apply formatting only to the text content
     if text:
-        # Handle strikethrough first (can combine with other formatting)
-        if md.strikethrough:
-            text = f"~~{text}~~"
-
-        # Handle combined bold and italic (***text***)
-        if md.bold and md.italic:
-            text = f"***{text}***"
-        # Handle bold only
-        elif md.bold:
-            text = f"**{text}**"
-        # Handle italic only
-        elif md.italic:
-            text = f"*{text}*"
+        prefix, suffix = _EMPHASIS_MARKERS[(md.bold, md.italic, md.strikethrough)]
+        text = prefix + text + suffix
 
     # Reconstruct with preserved spacing OUTSIDE markers
     return leading + text + trailing + newlines
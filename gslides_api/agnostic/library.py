@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr, model_validator
+import io
 import json
 
 from gslides_api.agnostic.presentation import MarkdownDeck, MarkdownSlide
@@ -69,30 +70,26 @@ example_slides = [
 ]
 
 
-def _element_names_match(library_slide: MarkdownSlide, parsed_slide: MarkdownSlide) -> bool:
-    """Check if parsed element names are a subset of library template names."""
-    library_names = {el.name for el in library_slide.elements}
-    parsed_names = {el.name for el in parsed_slide.elements}
-    return parsed_names.issubset(library_names)
-
-
-def _element_types_match(library_slide: MarkdownSlide, parsed_slide: MarkdownSlide) -> bool:
-    """Check if parsed element types match library types for elements that exist.
+def _elements_compatible(
+    library_slide: MarkdownSlide, parsed_slide: MarkdownSlide
+) -> tuple[bool, bool]:
+    """Check parsed elements against a library template in a single pass.
 
-    ContentType.ANY in library matches any specific content type.
+    Returns (names_match, types_match):
+    - names_match: parsed element names are a subset of library template names
+    - types_match: every parsed element exists in the library with a matching type;
+      ContentType.ANY in library matches any specific content type.
     """
     library_by_name = {el.name: el for el in library_slide.elements}
+    types_match = True
     for parsed_el in parsed_slide.elements:
-        if parsed_el.name not in library_by_name:
-            return False  # Name not in library
-        lib_el = library_by_name[parsed_el.name]
-        # ContentType.ANY in library matches any content type
-        if lib_el.content_type == ContentType.ANY:
-            continue
-        # Otherwise types must match exactly
-        if lib_el.content_type != parsed_el.content_type:
-            return False
-    return True
+        lib_el = library_by_name.get(parsed_el.name)
+        if lib_el is None:
+            return False, False  # Name not in library
+        # ContentType.ANY in library matches any content type, otherwise types must match
+        if lib_el.content_type != ContentType.ANY and lib_el.content_type != parsed_el.content_type:
+            types_match = False
+    return True, types_match
 
 
 def _create_empty_element(template_element: MarkdownSlideElement) -> MarkdownSlideElement:
@@ -135,18 +132,62 @@ def _merge_elements_with_template(
 class SlideLayoutLibrary(BaseModel):
     slides: list[MarkdownSlide]
 
+    # Maps slide name -> index of the first slide with that name in self.slides
+    _by_name: dict[str, int] = PrivateAttr(default_factory=dict)
+    # Length of self.slides when _by_name was last rebuilt, to catch direct inserts/removals
+    _indexed_len: int = PrivateAttr(default=0)
+
+    @model_validator(mode="after")
+    def build_name_index(self) -> "SlideLayoutLibrary":
+        self._rebuild_index()
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        # BaseModel.__eq__ also compares private attributes, which here are only caches
+        if not isinstance(other, SlideLayoutLibrary):
+            return NotImplemented
+        return self.slides == other.slides
+
+    def _rebuild_index(self) -> None:
+        by_name = {}
+        for i, slide in enumerate(self.slides):
+            by_name.setdefault(slide.name, i)
+        self._by_name = by_name
+        self._indexed_len = len(self.slides)
+
+    def _index_of(self, key: str) -> int | None:
+        """Return the index of the slide named `key`, or None if there is none.
+
+        A hit is trusted only if that slide still has the name and `slides` wasn't
+        resized; a miss may come from slides replaced or renamed in place, so either
+        way the index is rebuilt once and probed again.
+        """
+        i = self._by_name.get(key)
+        if (
+            i is not None
+            and len(self.slides) == self._indexed_len
+            and self.slides[i].name == key
+        ):
+            return i
+        self._rebuild_index()
+        return self._by_name.get(key)
+
     def __getitem__(self, key: str) -> MarkdownSlide:
-        for slide in self.slides:
-            if slide.name == key:
-                return slide
-        raise KeyError(f"Key {key} not found in slide library")
+        i = self._index_of(key)
+        if i is None:
+            raise KeyError(f"Key {key} not found in slide library")
+        return self.slides[i]
 
     def __setitem__(self, key: str, value: MarkdownSlide) -> None:
-        for i, slide in enumerate(self.slides):
-            if slide.name == key:
-                self.slides[i] = value
-                return
-        self.slides.append(value)
+        i = self._index_of(key)
+        if i is not None:
+            self.slides[i] = value
+            if value.name != key:
+                self._rebuild_index()
+        else:
+            self.slides.append(value)
+            self._by_name.setdefault(value.name, len(self.slides) - 1)
+            self._indexed_len = len(self.slides)
 
     def values(self) -> list[MarkdownSlide]:
         return self.slides
@@ -158,8 +199,6 @@ class SlideLayoutLibrary(BaseModel):
         return [(slide.name, slide) for slide in self.slides]
 
     def instructions(self) -> str:
-        desc = json.dumps([slide.to_markdown() for slide in self.slides])
-
         instructions = """Here is the list of available slides, separated by *****.
         A valid deck is a list of strings, EACH STRING DESCRIBING THE CONTENT OF ONE WHOLE SLIDE, 
         formatted as in the examples below.
@@ -172,7 +211,19 @@ class SlideLayoutLibrary(BaseModel):
         Here are the valid slide layouts:
         """
 
-        return instructions + desc
+        # Stream the JSON list of slide markdowns (same output as json.dumps on the
+        # list) without materializing every slide's markdown at once
+        buf = io.StringIO()
+        buf.write(instructions)
+        buf.write("[")
+        sep = ""
+        for slide in self.slides:
+            buf.write(sep)
+            buf.write(json.dumps(slide.to_markdown()))
+            sep = ", "
+        buf.write("]")
+
+        return buf.getvalue()
 
     def slide_from_markdown(self, markdown: str, name: str | None = None) -> MarkdownSlide:
         """
@@ -194,41 +245,42 @@ class SlideLayoutLibrary(BaseModel):
         parsed_slide = MarkdownSlide.from_markdown(markdown)
 
         # 2. Try to match by slide name first
-        if parsed_slide.name:
-            for library_slide in self.slides:
-                if library_slide.name == parsed_slide.name:
-                    # Verify element names are a subset of library names
-                    if not _element_names_match(library_slide, parsed_slide):
-                        parsed_names = [el.name for el in parsed_slide.elements]
-                        library_names = [el.name for el in library_slide.elements]
-                        raise ValueError(
-                            f"Element names don't match for slide '{parsed_slide.name}'. "
-                            f"Expected subset of {library_names}, got {parsed_names}"
-                        )
-                    # Verify element types match for provided elements
-                    if not _element_types_match(library_slide, parsed_slide):
-                        parsed_types = [
-                            (el.name, el.content_type.value) for el in parsed_slide.elements
-                        ]
-                        library_types = [
-                            (el.name, el.content_type.value) for el in library_slide.elements
-                        ]
-                        raise ValueError(
-                            f"Element types don't match for slide '{parsed_slide.name}'. "
-                            f"Library types: {library_types}, got {parsed_types}"
-                        )
-                    # Merge elements: fill missing with empty content
-                    parsed_slide.elements = _merge_elements_with_template(
-                        library_slide, parsed_slide
-                    )
-                    if name:
-                        parsed_slide.name = name
-
-                    return parsed_slide
+        index = self._index_of(parsed_slide.name) if parsed_slide.name else None
+        if index is not None:
+            library_slide = self.slides[index]
+            names_match, types_match = _elements_compatible(library_slide, parsed_slide)
+            # Verify element names are a subset of library names
+            if not names_match:
+                parsed_names = [el.name for el in parsed_slide.elements]
+                library_names = [el.name for el in library_slide.elements]
+                raise ValueError(
+                    f"Element names don't match for slide '{parsed_slide.name}'. "
+                    f"Expected subset of {library_names}, got {parsed_names}"
+                )
+            # Verify element types match for provided elements
+            if not types_match:
+                parsed_types = [(el.name, el.content_type.value) for el in parsed_slide.elements]
+                library_types = [(el.name, el.content_type.value) for el in library_slide.elements]
+                raise ValueError(
+                    f"Element types don't match for slide '{parsed_slide.name}'. "
+                    f"Library types: {library_types}, got {parsed_types}"
+                )
+            # Merge elements: fill missing with empty content
+            parsed_slide.elements = _merge_elements_with_template(library_slide, parsed_slide)
+            if name:
+                parsed_slide.name = name
+
+            return parsed_slide
 
         # 3. Try to match by element types (fallback)
+        # A layout with fewer elements than there are distinct parsed names can't
+        # contain them all, so skip it without building its name map
+        min_elements = len({el.name for el in parsed_slide.elements})
         for library_slide in self.slides:
-            if _element_types_match(library_slide, parsed_slide):
+            if len(library_slide.elements) < min_elements:
+                continue
+            _, types_match = _elements_compatible(library_slide, parsed_slide)
+            if types_match:
                 # Update parsed slide name if matched
                 parsed_slide.name = library_slide.name
                 # Merge elements: fill missing with empty content
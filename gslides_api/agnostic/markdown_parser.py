@@ -4,8 +4,8 @@ This module uses marko to parse markdown and converts it to a platform-agnostic
 that can then be converted to Google Slides, PowerPoint, or other formats.
 """
 
-import copy
 import logging
+from functools import lru_cache
 from typing import Any, Optional
 
 import marko
@@ -61,6 +61,35 @@ from gslides_api.agnostic.text import FullTextStyle
 logger = logging.getLogger(__name__)
 
 
+def _derive_style(
+    style: FullTextStyle,
+    markdown: Optional[dict[str, Any]] = None,
+    rich: Optional[dict[str, Any]] = None,
+) -> FullTextStyle:
+    """Return a copy of style with the given markdown/rich fields replaced.
+
+    Only the sub-styles that change are copied; everything else is shared with
+    the (unmodified) input, which is much cheaper than deep-copying the style.
+    """
+    update = {}
+    if markdown:
+        update["markdown"] = style.markdown.model_copy(update=markdown)
+    if rich:
+        update["rich"] = style.rich.model_copy(update=rich)
+    return style.model_copy(update=update)
+
+
+@lru_cache(maxsize=256)
+def _parse_markdown(markdown_text: str) -> marko.block.Document:
+    """Parse markdown with marko, reusing the AST for repeated identical text.
+
+    Parsing dominates markdown-to-IR conversion, and the same content is often
+    written many times (templated decks, re-renders). The returned AST is
+    shared, so it must not be mutated.
+    """
+    return marko.Markdown().parse(markdown_text)
+
+
 def parse_markdown_to_ir(
     markdown_text: str,
     base_style: Optional[FullTextStyle] = None,
@@ -86,11 +115,10 @@ def parse_markdown_to_ir(
     base_style = base_style or FullTextStyle()
 
     if heading_style is None:
-        heading_style = copy.deepcopy(base_style)
-        heading_style.markdown.bold = True
+        heading_style = _derive_style(base_style, markdown={"bold": True})
 
-    # Parse markdown with marko
-    doc = marko.Markdown().parse(markdown_text)
+    # Parse markdown with marko (cached per text; the AST is only read below)
+    doc = _parse_markdown(markdown_text)
 
     # Convert AST to IR
     return _markdown_ast_to_ir(doc, base_style=base_style, heading_style=heading_style, strict=strict)
@@ -118,8 +146,7 @@ def _markdown_ast_to_ir(
     """
     base_style = base_style or FullTextStyle()
     if heading_style is None:
-        heading_style = copy.deepcopy(base_style)
-        heading_style.markdown.bold = True
+        heading_style = _derive_style(base_style, markdown={"bold": True})
 
     document = FormattedDocument()
 
@@ -346,31 +373,29 @@ def _process_inline_node(
         return [FormattedTextRun(content="\n", style=base_style)]
 
     elif isinstance(node, marko.inline.CodeSpan):
-        code_style = copy.deepcopy(base_style)
-        code_style.markdown.is_code = True
-        code_style.rich.font_family = "Courier New"
+        code_style = _derive_style(
+            base_style, markdown={"is_code": True}, rich={"font_family": "Courier New"}
+        )
         return [FormattedTextRun(content=node.children, style=code_style)]
 
     elif isinstance(node, marko.inline.Emphasis):
-        italic_style = copy.deepcopy(base_style)
-        italic_style.markdown.italic = not italic_style.markdown.italic
+        italic_style = _derive_style(base_style, markdown={"italic": not base_style.markdown.italic})
         runs = []
         for child in node.children:
             runs.extend(_process_inline_node(child, italic_style, heading_style, list_depth, strict))
         return runs
 
     elif isinstance(node, marko.inline.StrongEmphasis):
-        bold_style = copy.deepcopy(base_style)
-        bold_style.markdown.bold = True
+        bold_style = _derive_style(base_style, markdown={"bold": True})
         runs = []
         for child in node.children:
             runs.extend(_process_inline_node(child, bold_style, heading_style, list_depth, strict))
         return runs
 
     elif isinstance(node, marko.inline.Link):
-        link_style = copy.deepcopy(base_style)
-        link_style.markdown.hyperlink = node.dest
-        link_style.rich.underline = True
+        link_style = _derive_style(
+            base_style, markdown={"hyperlink": node.dest}, rich={"underline": True}
+        )
         runs = []
         for child in node.children:
             runs.extend(_process_inline_node(child, link_style, heading_style, list_depth, strict))
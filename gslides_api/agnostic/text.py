@@ -15,6 +15,22 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+# Monospace font families for code detection (lowercase)
+MONOSPACE_FONTS = frozenset(
+    {
+        "courier new",
+        "courier",
+        "monospace",
+        "consolas",
+        "monaco",
+        "lucida console",
+        "dejavu sans mono",
+        "source code pro",
+        "fira code",
+        "jetbrains mono",
+    }
+)
+
 
 class BaselineOffset(Enum):
     """Vertical offset for text (superscript/subscript)."""
@@ -24,6 +40,10 @@ class BaselineOffset(Enum):
     SUBSCRIPT = "subscript"
 
 
+# Two-digit lowercase hex for every channel value, so to_hex only indexes
+_HEX = tuple(f"{i:02x}" for i in range(256))
+
+
 class AbstractColor(BaseModel):
     """Platform-agnostic color representation using 0.0-1.0 scale.
 
@@ -61,8 +81,14 @@ class AbstractColor(BaseModel):
     def to_hex(self) -> str:
         """Convert to hex color string (#RRGGBB)."""
         r, g, b = self.to_rgb_tuple()
+        if (r | g | b) >> 8 == 0:  # All channels in 0-255 (a negative one sets the high bits)
+            return "".join(("#", _HEX[r], _HEX[g], _HEX[b]))
         return f"#{r:02x}{g:02x}{b:02x}"
 
+    def value_key(self) -> tuple:
+        """Return a hashable key that is equal exactly when the colors are equal."""
+        return (self.red, self.green, self.blue, self.alpha, self.theme_color)
+
 
 class MarkdownRenderableStyle(BaseModel):
     """Properties that CAN be encoded in standard markdown.
@@ -110,44 +136,52 @@ class RichStyle(BaseModel):
 
     def is_monospace(self) -> bool:
         """Check if the font family is a monospace font."""
-        if not self.font_family:
+        font_family = self.font_family
+        if not font_family:
             return False
-        return self.font_family.lower() in [
-            "courier new",
-            "courier",
-            "monospace",
-            "consolas",
-            "monaco",
-            "lucida console",
-            "dejavu sans mono",
-            "source code pro",
-            "fira code",
-            "jetbrains mono",
-        ]
+        return font_family in MONOSPACE_FONTS or font_family.lower() in MONOSPACE_FONTS
 
     def is_default(self) -> bool:
         """Check if this is a default (empty) style with no properties set.
 
         A default style has no font, colors, or special formatting.
         """
+        # One dict comparison against a default instance instead of a field-by-field chain
+        return self is _DEFAULT_RICH_STYLE or self == _DEFAULT_RICH_STYLE
+
+    def value_key(self) -> tuple:
+        """Return a hashable key that is equal exactly when the styles are equal.
+
+        RichStyle stays mutable (and so unhashable), so dict/set-based
+        deduplication keys on this instead of the style itself.
+        """
+        fg = self.foreground_color
+        bg = self.background_color
+        # The seven boolean flags compare and hash as one small int
+        flags = (
+            self.underline
+            | self.small_caps << 1
+            | self.all_caps << 2
+            | self.shadow << 3
+            | self.emboss << 4
+            | self.imprint << 5
+            | self.double_strike << 6
+        )
         return (
-            self.font_family is None
-            and self.font_size_pt is None
-            and self.font_weight is None
-            and self.foreground_color is None
-            and self.background_color is None
-            and self.underline is False
-            and self.small_caps is False
-            and self.all_caps is False
-            and self.baseline_offset == BaselineOffset.NONE
-            and self.character_spacing is None
-            and self.shadow is False
-            and self.emboss is False
-            and self.imprint is False
-            and self.double_strike is False
+            self.font_family,
+            self.font_size_pt,
+            self.font_weight,
+            fg.value_key() if fg is not None else None,
+            bg.value_key() if bg is not None else None,
+            flags,
+            self.baseline_offset,
+            self.character_spacing,
         )
 
 
+_DEFAULT_RICH_STYLE = RichStyle()
+
+
 class FullTextStyle(BaseModel):
     """Complete style combining both markdown-renderable and rich parts.
 
@@ -22,6 +22,14 @@ class OutputUnit(Enum):
     PT = "pt"    # Points
 
 
+# EMUs per unit, so conversions are a single lookup instead of a chain of comparisons
+_EMU_PER_UNIT = {
+    OutputUnit.IN: EMU_PER_INCH,
+    OutputUnit.CM: EMU_PER_CM,
+    OutputUnit.PT: EMU_PER_PT,
+}
+
+
 def from_emu(value_emu: float, target_unit: OutputUnit) -> float:
     """Convert EMU value to target unit.
 
@@ -35,16 +43,12 @@ def from_emu(value_emu: float, target_unit: OutputUnit) -> float:
     Raises:
         ValueError: If target_unit is not a valid OutputUnit.
     """
-    if target_unit == OutputUnit.EMU:
+    if target_unit is OutputUnit.EMU:
         return value_emu
-    elif target_unit == OutputUnit.IN:
-        return value_emu / EMU_PER_INCH
-    elif target_unit == OutputUnit.CM:
-        return value_emu / EMU_PER_CM
-    elif target_unit == OutputUnit.PT:
-        return value_emu / EMU_PER_PT
-    else:
-        raise ValueError(f"Unknown unit: {target_unit}")
+    try:
+        return value_emu / _EMU_PER_UNIT[target_unit]
+    except KeyError:
+        raise ValueError(f"Unknown unit: {target_unit}") from None
 
 
 def to_emu(value: float, source_unit: OutputUnit) -> float:
@@ -60,13 +64,9 @@ def to_emu(value: float, source_unit: OutputUnit) -> float:
     Raises:
         ValueError: If source_unit is not a valid OutputUnit.
     """
-    if source_unit == OutputUnit.EMU:
+    if source_unit is OutputUnit.EMU:
         return value
-    elif source_unit == OutputUnit.IN:
-        return value * EMU_PER_INCH
-    elif source_unit == OutputUnit.CM:
-        return value * EMU_PER_CM
-    elif source_unit == OutputUnit.PT:
-        return value * EMU_PER_PT
-    else:
-        raise ValueError(f"Unknown unit: {source_unit}")
+    try:
+        return value * _EMU_PER_UNIT[source_unit]
+    except KeyError:
+        raise ValueError(f"Unknown unit: {source_unit}") from None
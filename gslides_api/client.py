@@ -1,14 +1,15 @@
 import logging
 import os
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, Dict, Optional
 
 from google.auth.credentials import Credentials as BaseCredentials
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import Resource, build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import Resource, build, build_from_document
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 from typeguard import typechecked
@@ -19,6 +20,30 @@ from gslides_api.request.request import DeleteObjectRequest, DuplicateObjectRequ
 from gslides_api.response import ImageThumbnail
 
 
+@lru_cache(maxsize=None)
+def _discovery_doc(api: str, version: str) -> Optional[str]:
+    """Returns the discovery document bundled with googleapiclient, read once per process."""
+    return discovery_cache.get_static_doc(api, version)
+
+
+def _build_service(api: str, version: str, credentials: Optional[BaseCredentials]) -> Resource:
+    """Builds a service from the bundled discovery document, without any HTTP fetch.
+
+    Falls back to build() if googleapiclient doesn't ship a document for the API.
+    """
+    doc = _discovery_doc(api, version)
+    if doc is None:
+        return build(api, version, credentials=credentials, cache_discovery=False)
+    # Pass the JSON string rather than a parsed dict: building a resource mutates the dict
+    return build_from_document(doc, credentials=credentials)
+
+
+@lru_cache(maxsize=8)
+def _load_token(path: str, mtime_ns: int, scopes: tuple[str, ...]) -> Credentials:
+    """Parses a token.json file, once per path and modification time."""
+    return Credentials.from_authorized_user_file(path, list(scopes))
+
+
 # The functions in this file are the only interaction with the raw gslides API in this library
 @typechecked
 class GoogleAPIClient:
@@ -52,6 +77,12 @@ class GoogleAPIClient:
             self.sld_srvc: Optional[Resource] = None
             self.drive_srvc: Optional[Resource] = None
 
+        # Services not built yet are requested from the parent, so each one is
+        # only ever built once per credentials
+        self._service_source = _shared_services
+        # Set by set_credentials: services are built on first access
+        self._lazy_services = False
+
         # Per-instance mutable batch state (never shared)
         self.pending_batch_requests: list[GSlidesAPIRequest] = []
         self.pending_presentation_id: Optional[str] = None
@@ -109,15 +140,40 @@ class GoogleAPIClient:
 
         """
         self.crdtls = credentials
-        logger.info("Building sheets connection")
-        self.sht_srvc = build("sheets", "v4", credentials=credentials)
-        logger.info("Built sheets connection")
-        logger.info("Building slides connection")
-        self.sld_srvc = build("slides", "v1", credentials=credentials)
-        logger.info("Built slides connection")
-        logger.info("Building drive connection")
-        self.drive_srvc = build("drive", "v3", credentials=credentials)
-        logger.info("Built drive connection")
+        # Services are built on first access, so callers only pay for the APIs they use
+        self.sht_srvc = None
+        self.sld_srvc = None
+        self.drive_srvc = None
+        self._service_source = None
+        self._lazy_services = True
+
+    def _get_service(self, attr: str, api: str, version: str) -> Resource:
+        """Returns the service stored in `attr`, building it on first access.
+
+        The service properties read their attribute directly and only call this
+        on a miss, so the steady state is a single attribute load.
+
+        Args:
+            attr: Name of the attribute caching the service
+            api: Google API name, e.g. "slides"
+            version: Google API version, e.g. "v1"
+
+        Raises:
+            RuntimeError: If set_credentials has not been called
+        """
+        service = getattr(self, attr)
+        if service is not None:
+            return service
+        if self._service_source is not None:
+            service = self._service_source._get_service(attr, api, version)
+        elif self._lazy_services:
+            service = _build_service(api, version, self.crdtls)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Built %s %s connection", api, version)
+        else:
+            raise RuntimeError("Must run set_credentials before executing method")
+        setattr(self, attr, service)
+        return service
 
     def initialize_credentials(self, credential_location: str) -> None:
         """Initialize credentials from a directory containing token.json/credentials.json.
@@ -131,11 +187,13 @@ class GoogleAPIClient:
             "https://www.googleapis.com/auth/drive",
         ]
 
-        _creds = None
-        if os.path.exists(os.path.join(credential_location, "token.json")):
-            _creds = Credentials.from_authorized_user_file(
-                os.path.join(credential_location, "token.json"), SCOPES
-            )
+        token_path = os.path.join(credential_location, "token.json")
+        try:
+            token_mtime_ns = os.stat(token_path).st_mtime_ns
+        except FileNotFoundError:
+            _creds = None
+        else:
+            _creds = _load_token(token_path, token_mtime_ns, tuple(SCOPES))
         if not _creds or not _creds.valid:
             if _creds and _creds.expired and _creds.refresh_token:
                 _creds.refresh(Request())
@@ -147,8 +205,9 @@ class GoogleAPIClient:
                     prompt="consent",
                     access_type="offline",
                 )
-            with open(os.path.join(credential_location, "token.json"), "w") as token:
+            with open(token_path, "w") as token:
                 token.write(_creds.to_json())
+            _load_token.cache_clear()
         self.set_credentials(_creds)
 
     @property
@@ -159,10 +218,10 @@ class GoogleAPIClient:
         :return: API connection
         :rtype: :class:`googleapiclient.discovery.Resource`
         """
-        if self.sht_srvc:
-            return self.sht_srvc
-        else:
-            raise RuntimeError("Must run set_credentials before executing method")
+        service = self.sht_srvc
+        if service is None:
+            service = self._get_service("sht_srvc", "sheets", "v4")
+        return service
 
     @property
     def slide_service(self) -> Resource:
@@ -172,10 +231,10 @@ class GoogleAPIClient:
         :return: API connection
         :rtype: :class:`googleapiclient.discovery.Resource`
         """
-        if self.sld_srvc:
-            return self.sld_srvc
-        else:
-            raise RuntimeError("Must run set_credentials before executing method")
+        service = self.sld_srvc
+        if service is None:
+            service = self._get_service("sld_srvc", "slides", "v1")
+        return service
 
     @property
     def drive_service(self) -> Resource:
@@ -185,10 +244,10 @@ class GoogleAPIClient:
         :return: API connection
         :rtype: :class:`googleapiclient.discovery.Resource`
         """
-        if self.drive_srvc:
-            return self.drive_srvc
-        else:
-            raise RuntimeError("Must run set_credentials before executing method")
+        service = self.drive_srvc
+        if service is None:
+            service = self._get_service("drive_srvc", "drive", "v3")
+        return service
 
     @property
     def is_initialized(self) -> bool:
@@ -197,9 +256,15 @@ class GoogleAPIClient:
         :return: True if all API services are initialized, False otherwise
         :rtype: bool
         """
+        if self.crdtls is None:
+            return False
+        # Services that aren't built yet count as ready if they can be built on demand
+        if self._lazy_services:
+            return True
+        if self._service_source is not None and self._service_source.is_initialized:
+            return True
         return (
-            self.crdtls is not None
-            and self.sht_srvc is not None
+            self.sht_srvc is not None
             and self.sld_srvc is not None
             and self.drive_srvc is not None
         )
@@ -9,7 +9,9 @@ class GSlidesBaseModel(BaseModel):
 
     def to_api_format(self) -> Dict[str, Any]:
         """Convert to the format expected by the Google Slides API."""
-        return super().model_dump(exclude_none=True, mode="json")
+        # Same as BaseModel.model_dump(exclude_none=True, mode="json"), calling the
+        # class's compiled serializer directly to skip model_dump's keyword plumbing
+        return self.__pydantic_serializer__.to_python(self, exclude_none=True, mode="json")
 
 
 class Unit(Enum):
@@ -692,30 +694,20 @@ class PageElementProperties(GSlidesBaseModel):
     _EMU_PER_CM = 360000  # 1 EMU = 1/360,000 cm
     _EMU_PER_INCH = 914400  # 1 inch = 914,400 EMUs
 
-    def _convert_emu_to_units(self, value_emu: float, units: OutputUnit) -> float:
-        """Convert a value from EMUs to the specified units.
-
-        Args:
-            value_emu: The value in EMUs to convert.
-            units: The target units (OutputUnit enum value).
-
-        Returns:
-            The converted value in the specified units.
+    @staticmethod
+    def _output_unit(units: OutputUnit) -> OutputUnit:
+        """Validate the requested units, accepting OutputUnit values such as "cm".
 
         Raises:
             TypeError: If units is not an OutputUnit enum value.
-            ValueError: If units is not a valid OutputUnit.
         """
+        if units.__class__ is OutputUnit:
+            return units
         try:
-            units = OutputUnit(units)
+            return OutputUnit(units)
         except Exception as e:
             raise TypeError(f"units must be an OutputUnit enum value, got {units}") from e
 
-        if not isinstance(units, OutputUnit):
-            raise TypeError(f"units must be an OutputUnit enum value, got {type(units)}")
-
-        return from_emu(value_emu, units)
-
     def absolute_size(self, units: OutputUnit) -> Tuple[float, float]:
         """Calculate the absolute size of the element in the specified units.
 
@@ -741,27 +733,19 @@ class PageElementProperties(GSlidesBaseModel):
         if self.transform is None:
             raise ValueError("Element transform is not available")
 
+        units = self._output_unit(units)
+
         # Extract width and height from size
         # Size can have width/height as either float or Dimension objects
-        if hasattr(self.size.width, "magnitude"):
-            width_emu = self.size.width.magnitude
-        else:
-            width_emu = self.size.width
-
-        if hasattr(self.size.height, "magnitude"):
-            height_emu = self.size.height.magnitude
-        else:
-            height_emu = self.size.height
-
-        # Apply transform scaling
-        actual_width_emu = width_emu * self.transform.scaleX
-        actual_height_emu = height_emu * self.transform.scaleY
-
-        # Convert from EMUs to the requested units
-        width_result = self._convert_emu_to_units(actual_width_emu, units)
-        height_result = self._convert_emu_to_units(actual_height_emu, units)
-
-        return width_result, height_result
+        width, height = self.size.width, self.size.height
+        width_emu = getattr(width, "magnitude", width)
+        height_emu = getattr(height, "magnitude", height)
+
+        # Apply transform scaling and convert from EMUs to the requested units
+        return (
+            from_emu(width_emu * self.transform.scaleX, units),
+            from_emu(height_emu * self.transform.scaleY, units),
+        )
 
     def absolute_position(self, units: OutputUnit = OutputUnit.CM) -> Tuple[float, float]:
         """Calculate the absolute position of the element on the page in the specified units.
@@ -786,8 +770,9 @@ class PageElementProperties(GSlidesBaseModel):
         y_emu = self.transform.translateY
 
         # Convert from EMUs to the requested units
-        x_result = self._convert_emu_to_units(x_emu, units)
-        y_result = self._convert_emu_to_units(y_emu, units)
+        units = self._output_unit(units)
+        x_result = from_emu(x_emu, units)
+        y_result = from_emu(y_emu, units)
 
         return x_result, y_result
 
@@ -821,7 +806,8 @@ class PageElementProperties(GSlidesBaseModel):
         actual_height_emu = height_emu * self.transform.scaleY
 
         # Convert from EMUs to the requested units
-        width_result = self._convert_emu_to_units(actual_width_emu, units)
-        height_result = self._convert_emu_to_units(actual_height_emu, units)
+        units = self._output_unit(units)
+        width_result = from_emu(actual_width_emu, units)
+        height_result = from_emu(actual_height_emu, units)
 
         return width_result, height_result
@@ -1,15 +1,17 @@
 import logging
 import uuid
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 from pydantic import Field
 
 import gslides_api
 from gslides_api.agnostic.element import MarkdownSlideElement
-from gslides_api.client import GoogleAPIClient, api_client
+from gslides_api.client import GoogleAPIClient
+from gslides_api.client import api_client as default_api_client
 from gslides_api.domain.domain import (
     GSlidesBaseModel,
+    Image,
     OutputUnit,
     PageElementProperties,
     Size,
@@ -52,7 +54,8 @@ class PageElementBase(GSlidesBaseModel):
     transform: Transform
     title: Optional[str] = None
     description: Optional[str] = None
-    type: ElementKind = Field(description="The type of page element", exclude=True)
+    # The type of page element, fixed by each subclass
+    type: ClassVar[ElementKind]
     # Store the presentation ID for reference but exclude from model_dump
     presentation_id: Optional[str] = Field(default=None, exclude=True)
     slide_id: Optional[str] = Field(default=None, exclude=True)
@@ -63,21 +66,13 @@ class PageElementBase(GSlidesBaseModel):
         presentation_id: str,
         api_client: Optional[GoogleAPIClient] = None,
     ):
-        client = api_client or globals()["api_client"]
-        request = self.create_request(parent_id)
-        out = client.batch_update(request, presentation_id)
-        try:
-            request_type = list(out["replies"][0].keys())[0]
-            new_element_id = out["replies"][0][request_type]["objectId"]
-            return new_element_id
-        except:
-            return None
+        return create_copies([self], parent_id, presentation_id, api_client=api_client)[0]
 
     def delete(self, api_client: Optional[GoogleAPIClient] = None) -> None:
         assert (
             self.presentation_id is not None
         ), "self.presentation_id must be set when calling delete()"
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
         client.delete_object(self.objectId, self.presentation_id)
 
     def element_properties(self, parent_id: str | None = None) -> PageElementProperties:
@@ -143,10 +138,9 @@ class PageElementBase(GSlidesBaseModel):
         url: str | None = None,
     ) -> "ImageElement":
         # Import inside method to avoid circular imports
-        from gslides_api.domain.domain import Image
         from gslides_api.element.image import ImageElement
 
-        api_client = api_client or globals()["api_client"]
+        api_client = api_client or default_api_client
         parent_id = parent_id or self.slide_id
         if isinstance(self, ImageElement):
             url = url or self.image.contentUrl
@@ -185,21 +179,20 @@ class PageElementBase(GSlidesBaseModel):
         :rtype: list
 
         """
-        if (
-            title is not None
-            or description is not None
-            or self.title is not None
-            or self.description is not None
-        ):
-            return [
-                UpdatePageElementAltTextRequest(
-                    objectId=element_id,
-                    title=title if title is not None else self.title,
-                    description=(description if description is not None else self.description),
-                )
-            ]
-        else:
+        if title is None:
+            title = self.title
+        if description is None:
+            description = self.description
+        # Most elements carry no alt text: return without building a request
+        if title is None and description is None:
             return []
+        return [
+            UpdatePageElementAltTextRequest(
+                objectId=element_id,
+                title=title,
+                description=description,
+            )
+        ]
 
     def set_alt_text(
         self,
@@ -207,7 +200,7 @@ class PageElementBase(GSlidesBaseModel):
         description: str | None = None,
         api_client: Optional[GoogleAPIClient] = None,
     ):
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
         if not title and not description:
             logger.warning(
                 "No alt text provided, skipping update. \n "
@@ -239,19 +232,12 @@ class PageElementBase(GSlidesBaseModel):
         presentation_id: Optional[str] = None,
         api_client: Optional[GoogleAPIClient] = None,
     ) -> Dict[str, Any]:
-        if element_id is None:
-            element_id = self.objectId
-
-        if presentation_id is None:
-            presentation_id = self.presentation_id
-
-        client = api_client or globals()["api_client"]
-        request_objects = self.element_to_update_request(element_id)
-        if len(request_objects):
-            out = client.batch_update(request_objects, presentation_id)
-            return out
-        else:
-            return {}
+        return update_elements(
+            [self],
+            presentation_id or self.presentation_id,
+            element_ids=[element_id],
+            api_client=api_client,
+        )
 
     def force_same_shape_as_me(self, target_id: str, api_client: Optional[GoogleAPIClient] = None):
         api_client = api_client or gslides_api.client.api_client
@@ -334,3 +320,81 @@ class PageElementBase(GSlidesBaseModel):
         This method should be overridden by subclasses.
         """
         raise NotImplementedError("Subclasses must implement to_markdown_element method")
+
+
+def update_elements(
+    elements: List[PageElementBase],
+    presentation_id: str,
+    element_ids: Optional[List[str]] = None,
+    api_client: Optional[GoogleAPIClient] = None,
+) -> Dict[str, Any]:
+    """Send the update requests for several elements in a single batch update.
+
+    Args:
+        elements: The elements whose state should be written
+        presentation_id: The presentation containing the target elements
+        element_ids: Optional ids of the elements to update, in the same order as
+            `elements`; a missing (None) id defaults to the element's own objectId
+        api_client: Optional client to use for the API call
+
+    Returns:
+        The batch update response, or {} if there was nothing to update
+    """
+    if element_ids is None:
+        element_ids = [element.objectId for element in elements]
+    elif len(element_ids) != len(elements):
+        raise ValueError("element_ids must have one id per element")
+
+    requests: List[GSlidesAPIRequest] = []
+    for element, element_id in zip(elements, element_ids):
+        requests.extend(element.element_to_update_request(element_id or element.objectId))
+    if not requests:
+        return {}
+
+    client = api_client or default_api_client
+    return client.batch_update(requests, presentation_id)
+
+
+def _reply_object_id(out: Dict[str, Any], index: int) -> Optional[str]:
+    """Return the objectId from the batch update reply at `index`, or None if absent."""
+    # A deferred batch update returns {}, so a missing reply is a normal outcome
+    # rather than an error: check for it instead of raising and catching
+    replies = out.get("replies") if out else None
+    if not replies or index >= len(replies):
+        return None
+    reply = replies[index]
+    if not reply:
+        return None
+    # Each reply holds a single entry keyed by the request type, e.g. "createShape"
+    return next(iter(reply.values())).get("objectId")
+
+
+def create_copies(
+    elements: List[PageElementBase],
+    parent_id: str,
+    presentation_id: str,
+    api_client: Optional[GoogleAPIClient] = None,
+) -> List[Optional[str]]:
+    """Create copies of several elements on a page in a single batch update.
+
+    Args:
+        elements: The elements to copy
+        parent_id: The id of the page to create the copies on
+        presentation_id: The presentation containing the page
+        api_client: Optional client to use for the API call
+
+    Returns:
+        The new element ids, in the same order as `elements`; None where the
+        reply carries no id (e.g. when the client defers flushing the batch)
+    """
+    requests: List[GSlidesAPIRequest] = []
+    # Replies come back one per request, in order: remember where each element's
+    # create request (always its first request) lands
+    reply_indices = []
+    for element in elements:
+        reply_indices.append(len(requests))
+        requests.extend(element.create_request(parent_id))
+
+    client = api_client or default_api_client
+    out = client.batch_update(requests, presentation_id)
+    return [_reply_object_id(out, i) for i in reply_indices]
@@ -1,6 +1,6 @@
-from typing import Annotated, Any, List, Union
+from typing import Annotated, Any, ClassVar, List, Union
 
-from pydantic import Discriminator, Field, Tag, field_validator
+from pydantic import Discriminator, Tag
 
 from gslides_api.domain.domain import (Group, Line, SheetsChart,
                                        SpeakerSpotlight, Video, WordArt)
@@ -12,50 +12,42 @@ from gslides_api.request.parent import GSlidesAPIRequest
 from gslides_api.request.request import (  # UpdateSheetsChartPropertiesRequest,; CreateWordArtRequest,
     CreateLineRequest, CreateSheetsChartRequest, CreateVideoRequest,
     UpdateLinePropertiesRequest, UpdateVideoPropertiesRequest)
-from gslides_api.utils import dict_to_dot_separated_field_list
+from gslides_api.utils import dict_to_field_mask
+
+
+# (field name, union tag) pairs, in the order the discriminator checks them
+_DISCRIMINATOR_KEYS = (
+    ("shape", "shape"),
+    ("table", "table"),
+    ("image", "image"),
+    ("video", "video"),
+    ("line", "line"),
+    ("wordArt", "wordArt"),
+    ("sheetsChart", "sheetsChart"),
+    ("speakerSpotlight", "speakerSpotlight"),
+    ("elementGroup", "group"),
+)
+
+# ElementKind -> union tag; the tags follow the API field names except for groups
+_KIND_TAGS = {kind: kind.value for kind in ElementKind}
+_KIND_TAGS[ElementKind.GROUP] = "group"
 
 
 def element_discriminator(v: Any) -> str:
     """Discriminator function to determine which PageElement subclass to use based on which field is present."""
     if isinstance(v, dict):
-        if v.get("shape") is not None:
-            return "shape"
-        elif v.get("table") is not None:
-            return "table"
-        elif v.get("image") is not None:
-            return "image"
-        elif v.get("video") is not None:
-            return "video"
-        elif v.get("line") is not None:
-            return "line"
-        elif v.get("wordArt") is not None:
-            return "wordArt"
-        elif v.get("sheetsChart") is not None:
-            return "sheetsChart"
-        elif v.get("speakerSpotlight") is not None:
-            return "speakerSpotlight"
-        elif v.get("elementGroup") is not None:
-            return "group"
-    else:
-        # Handle model instances
-        if hasattr(v, "shape") and v.shape is not None:
-            return "shape"
-        elif hasattr(v, "table") and v.table is not None:
-            return "table"
-        elif hasattr(v, "image") and v.image is not None:
-            return "image"
-        elif hasattr(v, "video") and v.video is not None:
-            return "video"
-        elif hasattr(v, "line") and v.line is not None:
-            return "line"
-        elif hasattr(v, "wordArt") and v.wordArt is not None:
-            return "wordArt"
-        elif hasattr(v, "sheetsChart") and v.sheetsChart is not None:
-            return "sheetsChart"
-        elif hasattr(v, "speakerSpotlight") and v.speakerSpotlight is not None:
-            return "speakerSpotlight"
-        elif hasattr(v, "elementGroup") and v.elementGroup is not None:
-            return "group"
+        get = v.get
+        for key, tag in _DISCRIMINATOR_KEYS:
+            if get(key) is not None:
+                return tag
+        return None
+
+    # Handle model instances: elements carry a validated `type`, which maps straight to the tag
+    if isinstance(v, PageElementBase):
+        return _KIND_TAGS[v.type]
+    for key, tag in _DISCRIMINATOR_KEYS:
+        if getattr(v, key, None) is not None:
+            return tag
 
     # Return None if no discriminator found - this will raise an error
     return None
@@ -65,14 +57,7 @@ class VideoElement(PageElementBase):
     """Represents a video element on a slide."""
 
     video: Video
-    type: ElementKind = Field(
-        default=ElementKind.VIDEO, description="The type of page element", exclude=True
-    )
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v):
-        return ElementKind.VIDEO
+    type: ClassVar[ElementKind] = ElementKind.VIDEO
 
     def create_request(self, parent_id: str) -> List[GSlidesAPIRequest]:
         """Convert a VideoElement to a create request for the Google Slides API."""
@@ -92,15 +77,13 @@ class VideoElement(PageElementBase):
         """Convert a VideoElement to an update request for the Google Slides API."""
         requests = self.alt_text_update_request(element_id)
 
-        if (
-            hasattr(self.video, "videoProperties")
-            and self.video.videoProperties is not None
-        ):
-            video_properties = self.video.videoProperties.to_api_format()
+        props = self.video.videoProperties
+        if props is not None:
+            # Pass the validated model rather than its dict, so it isn't re-validated
             video_request = UpdateVideoPropertiesRequest(
                 objectId=element_id,
-                videoProperties=video_properties,
-                fields=",".join(dict_to_dot_separated_field_list(video_properties)),
+                videoProperties=props,
+                fields=dict_to_field_mask(props.to_api_format()),
             )
             requests.append(video_request)
 
@@ -111,14 +94,7 @@ class LineElement(PageElementBase):
     """Represents a line element on a slide."""
 
     line: Line
-    type: ElementKind = Field(
-        default=ElementKind.LINE, description="The type of page element", exclude=True
-    )
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v):
-        return ElementKind.LINE
+    type: ClassVar[ElementKind] = ElementKind.LINE
 
     def create_request(self, parent_id: str) -> List[GSlidesAPIRequest]:
         """Convert a LineElement to a create request for the Google Slides API."""
@@ -133,15 +109,13 @@ class LineElement(PageElementBase):
         """Convert a LineElement to an update request for the Google Slides API."""
         requests = self.alt_text_update_request(element_id)
 
-        if (
-            hasattr(self.line, "lineProperties")
-            and self.line.lineProperties is not None
-        ):
-            line_properties = self.line.lineProperties.to_api_format()
+        props = self.line.lineProperties
+        if props is not None:
+            # Pass the validated model rather than its dict, so it isn't re-validated
             line_request = UpdateLinePropertiesRequest(
                 objectId=element_id,
-                lineProperties=line_properties,
-                fields=",".join(dict_to_dot_separated_field_list(line_properties)),
+                lineProperties=props,
+                fields=dict_to_field_mask(props.to_api_format()),
             )
             requests.append(line_request)
 
@@ -152,16 +126,7 @@ class WordArtElement(PageElementBase):
     """Represents a word art element on a slide."""
 
     wordArt: WordArt
-    type: ElementKind = Field(
-        default=ElementKind.WORD_ART,
-        description="The type of page element",
-        exclude=True,
-    )
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v):
-        return ElementKind.WORD_ART
+    type: ClassVar[ElementKind] = ElementKind.WORD_ART
 
     # def create_request(self, parent_id: str) -> List[GSlidesAPIRequest]:
     #     """Convert a WordArtElement to a create request for the Google Slides API."""
@@ -186,16 +151,7 @@ class SheetsChartElement(PageElementBase):
     """Represents a sheets chart element on a slide."""
 
     sheetsChart: SheetsChart
-    type: ElementKind = Field(
-        default=ElementKind.SHEETS_CHART,
-        description="The type of page element",
-        exclude=True,
-    )
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v):
-        return ElementKind.SHEETS_CHART
+    type: ClassVar[ElementKind] = ElementKind.SHEETS_CHART
 
     def create_request(self, parent_id: str) -> List[GSlidesAPIRequest]:
         """Convert a SheetsChartElement to a create request for the Google Slides API."""
@@ -217,15 +173,13 @@ class SheetsChartElement(PageElementBase):
     #     """Convert a SheetsChartElement to an update request for the Google Slides API."""
     #     requests = self.alt_text_update_request(element_id)
     #
-    #     if (
-    #         hasattr(self.sheetsChart, "sheetsChartProperties")
-    #         and self.sheetsChart.sheetsChartProperties is not None
-    #     ):
-    #         chart_properties = self.sheetsChart.sheetsChartProperties.to_api_format()
+    #     props = self.sheetsChart.sheetsChartProperties
+    #     if props is not None:
+    #         chart_properties = props.to_api_format()
     #         chart_request = UpdateSheetsChartPropertiesRequest(
     #             objectId=element_id,
     #             sheetsChartProperties=chart_properties,
-    #             fields=",".join(dict_to_dot_separated_field_list(chart_properties)),
+    #             fields=dict_to_field_mask(chart_properties),
     #         )
     #         requests.append(chart_request)
     #
@@ -236,16 +190,7 @@ class SpeakerSpotlightElement(PageElementBase):
     """Represents a speaker spotlight element on a slide."""
 
     speakerSpotlight: SpeakerSpotlight
-    type: ElementKind = Field(
-        default=ElementKind.SPEAKER_SPOTLIGHT,
-        description="The type of page element",
-        exclude=True,
-    )
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v):
-        return ElementKind.SPEAKER_SPOTLIGHT
+    type: ClassVar[ElementKind] = ElementKind.SPEAKER_SPOTLIGHT
 
     def create_request(self, parent_id: str) -> List[GSlidesAPIRequest]:
         """Convert a SpeakerSpotlightElement to a create request for the Google Slides API."""
@@ -265,14 +210,7 @@ class GroupElement(PageElementBase):
     """Represents a group element on a slide."""
 
     elementGroup: Group
-    type: ElementKind = Field(
-        default=ElementKind.GROUP, description="The type of page element", exclude=True
-    )
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v):
-        return ElementKind.GROUP
+    type: ClassVar[ElementKind] = ElementKind.GROUP
 
     def create_request(self, parent_id: str) -> List[GSlidesAPIRequest]:
         """Convert a GroupElement to a create request for the Google Slides API."""
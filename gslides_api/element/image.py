@@ -1,14 +1,26 @@
 import logging
 import mimetypes
 import uuid
-from typing import List, Literal, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, Dict, List, Literal, Optional
 from urllib.parse import urlparse
 
 import requests
-from pydantic import Field, field_validator
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from gslides_api.client import GoogleAPIClient
-from gslides_api.domain.domain import Image, ImageReplaceMethod, PageElementProperties
+from gslides_api.client import api_client as default_api_client
+from gslides_api.domain.domain import (
+    Dimension,
+    Image,
+    ImageProperties,
+    ImageReplaceMethod,
+    PageElementProperties,
+    Size,
+    Transform,
+    Unit,
+)
 from gslides_api.agnostic.domain import ImageData
 from gslides_api.element.base import ElementKind, PageElementBase
 from gslides_api.agnostic.element import MarkdownImageElement as MarkdownImageElement
@@ -18,23 +30,28 @@ from gslides_api.request.request import (
     ReplaceImageRequest,
     UpdateImagePropertiesRequest,
 )
-from gslides_api.utils import dict_to_dot_separated_field_list
+from gslides_api.utils import content_object_id, dict_to_field_mask
 
 logger = logging.getLogger(__name__)
 
+# Shared session, so downloading several images from the same host reuses connections
+# instead of paying a new TCP/TLS handshake per image
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504), raise_on_status=False
+    ),
+)
+_http_session.mount("https://", _http_adapter)
+_http_session.mount("http://", _http_adapter)
+
 
 class ImageElement(PageElementBase):
     """Represents an image element on a slide."""
 
     image: Image
-    type: ElementKind = Field(
-        default=ElementKind.IMAGE, description="The type of page element", exclude=True
-    )
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v):
-        return ElementKind.IMAGE
+    type: ClassVar[ElementKind] = ElementKind.IMAGE
 
     # @staticmethod
     # def create_image_request_like(
@@ -75,13 +92,14 @@ class ImageElement(PageElementBase):
         """Convert an ImageElement to an update request for the Google Slides API."""
         requests = self.alt_text_update_request(element_id)
 
-        if hasattr(self.image, "imageProperties") and self.image.imageProperties is not None:
-            image_properties = self.image.imageProperties.to_api_format()
+        props = self.image.imageProperties
+        if props is not None:
+            image_properties = props.to_api_format()
             # "fields": "*" causes an error
             request = UpdateImagePropertiesRequest(
                 objectId=element_id,
-                imageProperties=self.image.imageProperties,
-                fields=",".join(dict_to_dot_separated_field_list(image_properties)),
+                imageProperties=props,
+                fields=dict_to_field_mask(image_properties),
             )
             requests.append(request)
 
@@ -175,7 +193,7 @@ class ImageElement(PageElementBase):
         if url is not None and file is not None:
             raise ValueError("Must specify either url or file, not both")
 
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
         if file is not None:
             url = client.upload_image_to_drive(file)
 
@@ -204,8 +222,8 @@ class ImageElement(PageElementBase):
         logger.info("Downloading image from URL: %s", url)
 
         try:
-            # Download the image with retries for common network issues
-            response = requests.get(url, timeout=30)
+            # Download the image, retrying on connection errors and transient 5xx responses
+            response = _http_session.get(url, timeout=30)
             response.raise_for_status()
 
             content_length = len(response.content)
@@ -226,26 +244,25 @@ class ImageElement(PageElementBase):
         mime_type = response.headers.get("content-type", "application/octet-stream")
         logger.debug("Content-Type header: %s", mime_type)
 
+        # The URL path serves both the MIME type fallback and the filename
+        path = urlparse(url).path
+
         # If MIME type is not image-specific, try to guess from URL
-        if not mime_type.startswith("image/"):
-            parsed_url = urlparse(url)
-            path = parsed_url.path
-            if path:
-                guessed_type, _ = mimetypes.guess_type(path)
-                if guessed_type and guessed_type.startswith("image/"):
-                    logger.debug("Guessed MIME type from URL: %s -> %s", path, guessed_type)
-                    mime_type = guessed_type
-                else:
-                    logger.warning(
-                        "Could not determine image MIME type, using default: %s",
-                        mime_type,
-                    )
+        if not mime_type.startswith("image/") and path:
+            guessed_type, _ = mimetypes.guess_type(path)
+            if guessed_type and guessed_type.startswith("image/"):
+                logger.debug("Guessed MIME type from URL: %s -> %s", path, guessed_type)
+                mime_type = guessed_type
+            else:
+                logger.warning(
+                    "Could not determine image MIME type, using default: %s",
+                    mime_type,
+                )
 
         # Extract filename from URL if possible
         filename = None
-        parsed_url = urlparse(url)
-        if parsed_url.path:
-            filename = parsed_url.path.split("/")[-1]
+        if path:
+            filename = path.rsplit("/", 1)[-1]
             # Only keep if it looks like a filename with extension
             if "." not in filename:
                 filename = None
@@ -280,31 +297,25 @@ class ImageElement(PageElementBase):
         }
 
         # Store element properties (position, size, etc.) if available
-        if hasattr(self, "size") and self.size:
+        if self.size is not None:
             metadata["size"] = {
                 "width": self.size.width.magnitude,
                 "height": self.size.height.magnitude,
                 "unit": self.size.width.unit.value,
             }
 
-        if hasattr(self, "transform") and self.transform:
-            metadata["transform"] = (
-                self.transform.to_api_format() if hasattr(self.transform, "to_api_format") else None
-            )
+        if self.transform is not None:
+            metadata["transform"] = self.transform.to_api_format()
 
         # Store title and description if available
-        if hasattr(self, "title") and self.title:
+        if self.title:
             metadata["title"] = self.title
-        if hasattr(self, "description") and self.description:
+        if self.description:
             metadata["description"] = self.description
 
         # Store image properties if available
-        if hasattr(self.image, "imageProperties") and self.image.imageProperties:
-            metadata["imageProperties"] = (
-                self.image.imageProperties.to_api_format()
-                if hasattr(self.image.imageProperties, "to_api_format")
-                else None
-            )
+        if self.image.imageProperties is not None:
+            metadata["imageProperties"] = self.image.imageProperties.to_api_format()
 
         return MarkdownImageElement(name=name, content=markdown_content, metadata=metadata)
 
@@ -332,8 +343,6 @@ class ImageElement(PageElementBase):
 
         # Restore image properties if available
         if "imageProperties" in metadata and metadata["imageProperties"]:
-            from gslides_api.domain.domain import ImageProperties
-
             image.imageProperties = ImageProperties(**metadata["imageProperties"])
 
         # Create element properties from metadata
@@ -343,16 +352,12 @@ class ImageElement(PageElementBase):
         # Restore size if available, otherwise provide default
         if "size" in metadata:
             size_data = metadata["size"]
-            from gslides_api.domain.domain import Dimension, Size, Unit
-
             element_props.size = Size(
                 width=Dimension(magnitude=size_data["width"], unit=Unit(size_data["unit"])),
                 height=Dimension(magnitude=size_data["height"], unit=Unit(size_data["unit"])),
             )
         else:
             # Provide default size for images
-            from gslides_api.domain.domain import Dimension, Size, Unit
-
             element_props.size = Size(
                 width=Dimension(magnitude=200, unit=Unit.PT),
                 height=Dimension(magnitude=150, unit=Unit.PT),
@@ -360,21 +365,17 @@ class ImageElement(PageElementBase):
 
         # Restore transform if available, otherwise create default
         if "transform" in metadata and metadata["transform"]:
-            from gslides_api.domain.domain import Transform
-
             transform_data = metadata["transform"]
             element_props.transform = Transform(**transform_data)
         else:
             # Create a default identity transform
-            from gslides_api.domain.domain import Transform
-
             element_props.transform = Transform(
                 scaleX=1.0, scaleY=1.0, translateX=0.0, translateY=0.0, unit="EMU"
             )
 
         # Create the image element
         image_element = cls(
-            objectId=object_id or "image_" + str(hash(markdown_elem.content))[:8],
+            objectId=object_id or content_object_id("image", markdown_elem.content),
             size=element_props.size,
             transform=element_props.transform,
             title=metadata.get("title"),
@@ -385,3 +386,57 @@ class ImageElement(PageElementBase):
         )
 
         return image_element
+
+
+def get_images_data(images: List[ImageElement], max_workers: int = 8) -> List[ImageData]:
+    """Download the data of several images concurrently.
+
+    Downloads are I/O bound, so running them on a thread pool (through the shared
+    session's connection pool) takes about as long as the slowest one rather than
+    the sum of all of them.
+
+    Args:
+        images: The image elements to download
+        max_workers: Maximum number of concurrent downloads
+
+    Returns:
+        The ImageData of each image, in the same order as `images`
+
+    Raises:
+        ValueError: If an image has no URL available.
+        requests.RequestException: If a download fails.
+    """
+    if len(images) <= 1:
+        return [image.get_image_data() for image in images]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(images))) as executor:
+        return list(executor.map(ImageElement.get_image_data, images))
+
+
+def replace_images(
+    urls: Dict[str, str],
+    presentation_id: str,
+    method: ImageReplaceMethod | None = None,
+    api_client: Optional[GoogleAPIClient] = None,
+) -> Dict[str, Any]:
+    """Replace several images by URL in a single batch update.
+
+    Args:
+        urls: New image URL for each image id to replace
+        presentation_id: The presentation containing the images
+        method: Optional image replacement method, applied to every image
+        api_client: Optional client to use for the API call
+
+    Returns:
+        The batch update response, or {} if there was nothing to replace
+
+    Raises:
+        ValueError: If a URL doesn't start with http:// or https://
+    """
+    batch_requests = []
+    for image_id, url in urls.items():
+        batch_requests.extend(ImageElement._replace_image_requests(image_id, url, method))
+    if not batch_requests:
+        return {}
+
+    client = api_client or default_api_client
+    return client.batch_update(batch_requests, presentation_id)
@@ -1,7 +1,7 @@
 import logging
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
-from pydantic import Field, field_validator
+from pydantic import Field
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)  # Enable DEBUG for shape.py to trace write_text
@@ -33,6 +33,7 @@ from gslides_api.request.request import (
     DeleteTextRequest,
     UpdateTextStyleRequest,
 )
+from gslides_api.utils import content_object_id
 
 
 class Placeholder(GSlidesBaseModel):
@@ -68,14 +69,7 @@ class ShapeElement(PageElementBase):
     """Represents a shape element on a slide."""
 
     shape: Shape
-    type: ElementKind = Field(
-        default=ElementKind.SHAPE, description="The type of page element", exclude=True
-    )
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v):
-        return ElementKind.SHAPE
+    type: ClassVar[ElementKind] = ElementKind.SHAPE
 
     def create_request(self, parent_id: str) -> List[GSlidesAPIRequest]:
         """Convert a PageElement to a create request for the Google Slides API."""
@@ -134,7 +128,7 @@ class ShapeElement(PageElementBase):
 
         If no styles are found in the text, falls back to placeholder styles.
         """
-        if not hasattr(self.shape, "text") or self.shape.text is None:
+        if self.shape.text is None:
             styles = None
         else:
             styles = self.shape.text.styles(skip_whitespace)
@@ -229,29 +223,28 @@ class ShapeElement(PageElementBase):
         }
 
         # Store element properties (position, size, etc.) if available
-        if hasattr(self, "size") and self.size:
+        if self.size is not None:
             metadata["size"] = {
                 "width": self.size.width.magnitude,
                 "height": self.size.height.magnitude,
                 "unit": self.size.width.unit.value,
             }
 
-        if hasattr(self, "transform") and self.transform:
-            metadata["transform"] = (
-                self.transform.to_api_format() if hasattr(self.transform, "to_api_format") else None
-            )
+        if self.transform is not None:
+            metadata["transform"] = self.transform.to_api_format()
 
         # Store title and description if available
-        if hasattr(self, "title") and self.title:
+        if self.title:
             metadata["title"] = self.title
-        if hasattr(self, "description") and self.description:
+        if self.description:
             metadata["description"] = self.description
 
         # Store text styles if available
-        if self.styles():
+        styles = self.styles()
+        if styles:
             metadata["styles"] = [
                 style.to_api_format() if hasattr(style, "to_api_format") else str(style)
-                for style in self.styles()
+                for style in styles
             ]
 
         return MarkdownTextElement(name=name, content=content, metadata=metadata)
@@ -272,9 +265,6 @@ class ShapeElement(PageElementBase):
         stored_shape_type = metadata.get("shape_type") or shape_type or "TEXT_BOX"
 
         # Create basic shape with text content
-        from gslides_api.domain.text import ShapeProperties
-        from gslides_api.element.text_content import TextContent
-
         # Create a minimal shape - the actual content will be written via write_text
         shape = Shape(
             shapeProperties=ShapeProperties(),
@@ -310,7 +300,7 @@ class ShapeElement(PageElementBase):
 
         # Create the shape element
         shape_element = cls(
-            objectId=object_id or "shape_" + str(hash(markdown_elem.content))[:8],
+            objectId=object_id or content_object_id("shape", markdown_elem.content),
             size=element_props.size,
             transform=element_props.transform,
             title=metadata.get("title"),
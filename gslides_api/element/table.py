@@ -1,8 +1,7 @@
 import uuid
 from copy import deepcopy
-from typing import Any, List, Optional, Sequence, Tuple
+from typing import Any, ClassVar, List, Optional, Sequence, Tuple
 
-from pydantic import Field, field_validator
 from typeguard import typechecked
 
 from gslides_api.client import GoogleAPIClient
@@ -20,6 +19,7 @@ from gslides_api.domain.table import (
 from gslides_api.domain.table_cell import TableCellLocation
 from gslides_api.domain.text import TextStyle
 from gslides_api.element.base import ElementKind, PageElementBase
+from gslides_api.element.text_content import TextContent
 from gslides_api.agnostic.element import MarkdownTableElement as MarkdownTableElement, TableData
 from gslides_api.request.parent import GSlidesAPIRequest
 from gslides_api.request.request import UpdatePageElementAltTextRequest
@@ -36,19 +36,16 @@ from gslides_api.request.table import (
 )
 
 
+# Table structure fields copied verbatim into the markdown element's metadata
+_RAW_TABLE_FIELDS = ("tableRows", "tableColumns", "horizontalBorderRows", "verticalBorderRows")
+
+
 @typechecked
 class TableElement(PageElementBase):
     """Represents a table element on a slide."""
 
     table: Table
-    type: ElementKind = Field(
-        default=ElementKind.TABLE, description="The type of page element", exclude=True
-    )
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v):
-        return ElementKind.TABLE
+    type: ClassVar[ElementKind] = ElementKind.TABLE
 
     def absolute_size(
         self, units: OutputUnit, location: Optional[TableCellLocation] = None
@@ -199,8 +196,6 @@ class TableElement(PageElementBase):
                 )
             else:
                 # Cell exists but has no text content (empty cell from API)
-                from gslides_api.element.text_content import TextContent
-
                 temp_text_content = TextContent(textElements=[])
                 requests = temp_text_content.write_text_requests(
                     text=text,
@@ -214,8 +209,6 @@ class TableElement(PageElementBase):
         else:
             # Table structure not populated yet (e.g., during creation from markdown)
             # Create a temporary TextContent to generate the requests
-            from gslides_api.element.text_content import TextContent
-
             temp_text_content = TextContent(textElements=[])
 
             # Try to copy styles from existing cells in the same row
@@ -400,14 +393,10 @@ class TableElement(PageElementBase):
                 requests = cell.text.delete_text_request(self.objectId)
             else:
                 # Cell exists but has no text content (empty cell from API)
-                from gslides_api.element.text_content import TextContent
-
                 temp_text_content = TextContent(textElements=[])
                 requests = temp_text_content.delete_text_request(self.objectId)
         else:
             # Table structure not populated yet - create generic delete requests
-            from gslides_api.element.text_content import TextContent
-
             temp_text_content = TextContent(textElements=[])
             requests = temp_text_content.delete_text_request(self.objectId)
 
@@ -431,14 +420,15 @@ class TableElement(PageElementBase):
             headers = [cell.strip() for cell in all_cell_text[0]]
 
             # Remaining rows are data
+            n_columns = len(headers)
             rows = []
             for row_data in all_cell_text[1:]:
-                row_cells = [cell.strip() for cell in row_data]
-                # Pad row with empty strings if it's shorter than headers
-                while len(row_cells) < len(headers):
-                    row_cells.append("")
                 # Trim if longer than headers
-                rows.append(row_cells[: len(headers)])
+                row_cells = [cell.strip() for cell in row_data[:n_columns]]
+                # Pad row with empty strings if it's shorter than headers
+                if len(row_cells) < n_columns:
+                    row_cells.extend([""] * (n_columns - len(row_cells)))
+                rows.append(row_cells)
 
         except (AttributeError, IndexError):
             raise ValueError("Could not extract table data - table structure may be invalid")
@@ -452,9 +442,8 @@ class TableElement(PageElementBase):
         """Convert TableElement to MarkdownTableElement for round-trip conversion."""
 
         # Check if we have stored table data from markdown conversion
-        if hasattr(self, "_markdown_table_data") and self._markdown_table_data:
-            table_data = self._markdown_table_data
-        else:
+        table_data = getattr(self, "_markdown_table_data", None)
+        if not table_data:
             # Extract table data from Google Slides structure
             try:
                 table_data = self.extract_table_data()
@@ -470,33 +459,27 @@ class TableElement(PageElementBase):
         }
 
         # Store element properties (position, size, etc.) if available
-        if hasattr(self, "size") and self.size:
+        if self.size is not None:
             metadata["size"] = {
                 "width": self.size.width.magnitude,
                 "height": self.size.height.magnitude,
                 "unit": self.size.width.unit.value,
             }
 
-        if hasattr(self, "transform") and self.transform:
-            metadata["transform"] = (
-                self.transform.to_api_format() if hasattr(self.transform, "to_api_format") else None
-            )
+        if self.transform is not None:
+            metadata["transform"] = self.transform.to_api_format()
 
         # Store title and description if available
-        if hasattr(self, "title") and self.title:
+        if self.title:
             metadata["title"] = self.title
-        if hasattr(self, "description") and self.description:
+        if self.description:
             metadata["description"] = self.description
 
         # Store raw table structure for perfect reconstruction
-        if self.table.tableRows:
-            metadata["tableRows"] = self.table.tableRows
-        if self.table.tableColumns:
-            metadata["tableColumns"] = self.table.tableColumns
-        if self.table.horizontalBorderRows:
-            metadata["horizontalBorderRows"] = self.table.horizontalBorderRows
-        if self.table.verticalBorderRows:
-            metadata["verticalBorderRows"] = self.table.verticalBorderRows
+        for field in _RAW_TABLE_FIELDS:
+            value = getattr(self.table, field)
+            if value:
+                metadata[field] = value
 
         return MarkdownTableElement(name=name, content=table_data, metadata=metadata)
 
@@ -526,8 +509,6 @@ class TableElement(PageElementBase):
         num_cols = len(table_data.headers)
 
         # Create temporary TableElement to generate the structure creation request
-        from gslides_api.domain.domain import Unit
-
         # Basic sizing: 100pt per column, 30pt per row
         default_width = max(300, num_cols * 100)
         default_height = max(150, num_rows * 30)
@@ -639,9 +620,6 @@ class TableElement(PageElementBase):
         Returns:
             List of UpdateTableColumnPropertiesRequest to set column widths
         """
-        from gslides_api.domain.table import TableColumnProperties
-        from gslides_api.request.table import UpdateTableColumnPropertiesRequest
-
         requests = []
 
         # Only proceed if we have column width information
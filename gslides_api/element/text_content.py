@@ -47,15 +47,18 @@ class TextContent(GSlidesBaseModel):
         """
         if not self.textElements:
             return None
-        styles = []
+        # Keyed by value so deduplication is one dict probe per run; dicts keep
+        # insertion order, so styles come out in order of first appearance
+        unique: Dict[tuple, RichStyle] = {}
+        style_cache: dict = {}
         for te in self.textElements:
             if te.textRun is None:
                 continue
             if skip_whitespace and te.textRun.content.strip() == "":
                 continue
-            rich_style = gslides_style_to_rich(te.textRun.style)
-            if rich_style not in styles:
-                styles.append(rich_style)
+            rich_style = gslides_style_to_rich(te.textRun.style, style_cache)
+            unique.setdefault(rich_style.value_key(), rich_style)
+        styles = list(unique.values())
 
         # If skipping whitespace yielded no styles, retry including whitespace
         if not styles and skip_whitespace:
@@ -89,12 +92,13 @@ class TextContent(GSlidesBaseModel):
             return ir_to_markdown(ir_doc)
         else:
             out = []
+            append = out.append
             for te in self.textElements:
-                if te.textRun is not None:
-                    out.append(te.textRun.content)
-                elif te.paragraphMarker is not None:
-                    if len(out) > 0:
-                        out.append("\n")
+                text_run = te.textRun
+                if text_run is not None:
+                    append(text_run.content)
+                elif te.paragraphMarker is not None and out:
+                    append("\n")
             return "".join(out)
 
     def delete_text_request(self, object_id: str = "") -> List[GSlidesAPIRequest]:
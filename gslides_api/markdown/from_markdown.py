@@ -497,10 +497,11 @@ def text_elements_to_requests(
 ) -> Tuple[List[GSlidesAPIRequest], List[LineBreakInsideList]]:
     requests = []
     newlines = []
+    append = requests.append
     for te in text_elements:
         if isinstance(te, GSlidesAPIRequest):
             te.objectId = objectId
-            requests.append(te)
+            append(te)
             continue
         else:
             assert isinstance(te, TextElement), f"Expected TextElement, got {te}"
@@ -538,5 +539,6 @@ def text_elements_to_requests(
             newline.previous_element = update_style_request
         newlines.append(newline)
 
-        requests.extend([insert_request, update_style_request])
+        append(insert_request)
+        append(update_style_request)
     return requests, newlines
@@ -123,10 +123,11 @@ def _get_effective_format(how: Optional[str]) -> OutputFormat:
 
 def _format_response(data: Any, error: Optional[ErrorResponse] = None) -> str:
     """Format a response as JSON string."""
+    # Models serialize straight to JSON in pydantic-core, without an intermediate dict
     if error is not None:
-        return json.dumps(error.model_dump(), indent=2)
-    if hasattr(data, "model_dump"):
-        return json.dumps(data.model_dump(), indent=2)
+        return error.model_dump_json(indent=2)
+    if hasattr(data, "model_dump_json"):
+        return data.model_dump_json(indent=2)
     return json.dumps(data, indent=2, default=str)
 
 
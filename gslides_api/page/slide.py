@@ -4,11 +4,13 @@ from typing import Optional
 
 from pydantic import Field, field_validator
 
-from gslides_api.client import GoogleAPIClient, api_client
+from gslides_api.client import GoogleAPIClient
+from gslides_api.client import api_client as default_api_client
 from gslides_api.domain.domain import (LayoutReference, ThumbnailProperties,
                                        ThumbnailSize, Transform)
 from gslides_api.domain.request import Range, RangeType
 from gslides_api.domain.text import ShapeProperties
+from gslides_api.element.base import create_copies, update_elements
 from gslides_api.element.shape import Shape, ShapeElement
 from gslides_api.page.base import (BasePage, ElementKind, PageType,
                                    UpdatePagePropertiesRequest)
@@ -18,7 +20,7 @@ from gslides_api.request.request import (CreateSlideRequest, DeleteTextRequest,
                                          InsertTextRequest,
                                          UpdateSlidesPositionRequest)
 from gslides_api.response import ImageThumbnail
-from gslides_api.utils import dict_to_dot_separated_field_list
+from gslides_api.utils import dict_to_field_mask
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +47,7 @@ class Slide(BasePage):
         assert (
             self.presentation_id is not None
         ), "self.presentation_id must be set when calling duplicate()"
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
 
         id_map = {self.objectId: uuid.uuid4().hex}  # to avoid force flushing
         for e in self.page_elements_flat:
@@ -67,7 +69,7 @@ class Slide(BasePage):
             self.presentation_id is not None
         ), "self.presentation_id must be set when calling delete()"
 
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
         return client.delete_object(self.objectId, self.presentation_id)
 
     def move(
@@ -79,7 +81,7 @@ class Slide(BasePage):
         Args:
             insertion_index: The index to insert the slide at.
         """
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
         request = UpdateSlidesPositionRequest(
             slideObjectIds=[self.objectId], insertionIndex=insertion_index
         )
@@ -97,7 +99,7 @@ class Slide(BasePage):
             presentation_id: The ID of the presentation to write to.
             insertion_index: The index to insert the slide at. If not provided, the slide will be added at the end.
         """
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
         presentation_id = presentation_id or self.presentation_id
 
         # This method is primarily for slides, so we need to check if we have slide properties
@@ -121,7 +123,7 @@ class Slide(BasePage):
             request = UpdatePagePropertiesRequest(
                 objectId=slide_id,
                 pageProperties=page_properties,
-                fields=",".join(dict_to_dot_separated_field_list(page_properties)),
+                fields=dict_to_field_mask(page_properties),
             )
             client.batch_update([request], presentation_id)
         except Exception as e:
@@ -136,25 +138,43 @@ class Slide(BasePage):
         request = UpdateSlidePropertiesRequest(
             objectId=slide_id,
             slideProperties=slide_properties,
-            fields=",".join(dict_to_dot_separated_field_list(slide_properties)),
+            fields=dict_to_field_mask(slide_properties),
         )
         client.batch_update([request], presentation_id)
 
         if self.pageElements is not None:
             # Some elements came from layout, some were created manually
             # Let's first match those that came from layout, before creating new ones
+            elements_to_update = []
+            element_ids = []
             for kind in ElementKind:
                 my_elements = self.select_elements(kind)
                 layout_elements = new_slide.select_elements(kind)
                 for i, element in enumerate(my_elements):
-                    if i < len(layout_elements):
-                        element_id = layout_elements[i].objectId
-                    else:
-                        element_id = element.create_copy(slide_id, presentation_id)
-                    element.update(
-                        presentation_id=presentation_id, element_id=element_id
+                    elements_to_update.append(element)
+                    element_ids.append(
+                        layout_elements[i].objectId if i < len(layout_elements) else None
                     )
 
+            # Create the elements that have no layout counterpart in one batch update
+            to_copy = [i for i, element_id in enumerate(element_ids) if element_id is None]
+            if to_copy:
+                new_ids = create_copies(
+                    [elements_to_update[i] for i in to_copy],
+                    slide_id,
+                    presentation_id,
+                    api_client=client,
+                )
+                for i, new_id in zip(to_copy, new_ids):
+                    element_ids[i] = new_id
+            # Send all the element updates in one batch update rather than one per element
+            update_elements(
+                elements_to_update,
+                presentation_id,
+                element_ids=element_ids,
+                api_client=client,
+            )
+
         return self.from_ids(presentation_id, slide_id, api_client=api_client)
 
     @classmethod
@@ -175,7 +195,7 @@ class Slide(BasePage):
             layoout_placeholder_id_mapping: The mapping of placeholder IDs to use for the slide.
         """
 
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
         request = CreateSlideRequest(
             insertionIndex=insertion_index, slideLayoutReference=slide_layout_reference
         )
@@ -207,7 +227,7 @@ class Slide(BasePage):
     ) -> None:
         # This assumes the speaker notes don't exist yet
         # Apparently even if the notes element doesn't exist, the API creates it upon the first insertTextRequest
-        api_client = api_client or globals()["api_client"]
+        api_client = api_client or default_api_client
 
         notes_id = self.slideProperties.notesPage.notesProperties.speakerNotesObjectId
 
@@ -226,7 +246,7 @@ class Slide(BasePage):
 
     def sync_from_cloud(self):
         new_state = Slide.from_ids(
-            self.presentation_id, self.objectId, api_client=api_client
+            self.presentation_id, self.objectId, api_client=default_api_client
         )
         self.__dict__ = new_state.__dict__
 
@@ -235,6 +255,6 @@ class Slide(BasePage):
         size: Optional[ThumbnailSize] = None,
         api_client: Optional[GoogleAPIClient] = None,
     ) -> ImageThumbnail:
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
         props = ThumbnailProperties(thumbnailSize=size)
         return client.slide_thumbnail(self.presentation_id, self.objectId, props)
@@ -4,7 +4,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import model_validator
 
-from gslides_api.client import GoogleAPIClient, api_client
+from gslides_api.client import GoogleAPIClient
+from gslides_api.client import api_client as default_api_client
 from gslides_api.domain.domain import GSlidesBaseModel, Size
 from gslides_api.element.base import ElementKind
 from gslides_api.element.element import PageElement
@@ -34,7 +35,7 @@ class Presentation(GSlidesBaseModel):
         api_client: Optional[GoogleAPIClient] = None,
     ) -> "Presentation":
         """Create a blank presentation in Google Slides."""
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
         new_id = client.create_presentation({"title": title})
         return cls.from_id(new_id, api_client=api_client)
 
@@ -63,7 +64,7 @@ class Presentation(GSlidesBaseModel):
     def from_id(
         cls, presentation_id: str, api_client: Optional[GoogleAPIClient] = None
     ) -> "Presentation":
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
         presentation_json = client.get_presentation_json(presentation_id)
         return cls.from_json(presentation_json)
 
@@ -71,7 +72,7 @@ class Presentation(GSlidesBaseModel):
         self, api_client: Optional[GoogleAPIClient] = None
     ) -> "Presentation":
         """Clone a presentation in Google Slides."""
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
         config = self.to_api_format()
         config.pop("presentationId", None)
         config.pop("revisionId", None)
@@ -84,7 +85,7 @@ class Presentation(GSlidesBaseModel):
         api_client: Optional[GoogleAPIClient] = None,
         folder_id: Optional[str] = None,
     ):
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
         copy_title = copy_title or f"Copy of {self.title}"
         new = client.copy_presentation(
             self.presentationId, copy_title, folder_id=folder_id
@@ -105,7 +106,7 @@ class Presentation(GSlidesBaseModel):
         return match[0]
 
     def delete_slide(self, slide_id: str, api_client: Optional[GoogleAPIClient] = None):
-        client = api_client or globals()["api_client"]
+        client = api_client or default_api_client
         client.delete_object(slide_id, self.presentationId)
 
     def get_slide_by_name(self, slide_name: str) -> Optional[Slide]:
@@ -1,18 +1,45 @@
+import hashlib
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 logger = logging.getLogger(__name__)
 
 
-def dict_to_dot_separated_field_list(x: Dict[str, Any]) -> List[str]:
-    """Convert a dictionary to a list of dot-separated fields."""
-    out = []
+def _iter_dot_separated_fields(x: Dict[str, Any], prefix: str = "") -> Iterator[str]:
+    """Yield the dot-separated paths to the leaves of a nested dictionary.
+
+    Each leaf path is built once from its parent's prefix, rather than being
+    re-prefixed at every level on the way back up.
+    """
     for k, v in x.items():
         if isinstance(v, dict):
-            out += [f"{k}.{i}" for i in dict_to_dot_separated_field_list(v)]
+            yield from _iter_dot_separated_fields(v, f"{prefix}{k}.")
         else:
-            out.append(k)
-    return out
+            yield prefix + k
+
+
+def dict_to_dot_separated_field_list(x: Dict[str, Any]) -> List[str]:
+    """Convert a dictionary to a list of dot-separated fields."""
+    return list(_iter_dot_separated_fields(x))
+
+
+def dict_to_field_mask(x: Dict[str, Any]) -> str:
+    """Convert a dictionary to a comma-separated field mask for update requests.
+
+    The mask follows the keys actually present, so properties left unset
+    (dropped by to_api_format) are not reset by the update.
+    """
+    return ",".join(_iter_dot_separated_fields(x))
+
+
+def content_object_id(prefix: str, content: str | None) -> str:
+    """Build an object ID from an element's content, for elements that don't have one.
+
+    Unlike the built-in hash(), which is salted per interpreter run, the digest
+    is stable, so the same content always maps to the same ID.
+    """
+    digest = hashlib.blake2b((content or "").encode(), digest_size=4).hexdigest()
+    return f"{prefix}_{digest}"
 
 
 def image_url_is_valid(url: str) -> bool:
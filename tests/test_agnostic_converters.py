@@ -330,6 +330,14 @@ class TestGSlidesToFull:
         result = gslides_style_to_full(None)
         assert result == FullTextStyle()
 
+    def test_none_style_results_are_independent(self):
+        """Mutating the default for one style-less run must not affect later ones."""
+        first = gslides_style_to_full(None)
+        first.markdown.italic = True
+        first.rich.underline = True
+        assert gslides_style_to_full(None) == FullTextStyle()
+        assert gslides_style_to_rich(None) == RichStyle()
+
     def test_bold_italic_strikethrough(self):
         """Bold, italic, strikethrough should go to markdown part."""
         style = TextStyle(bold=True, italic=True, strikethrough=True)
@@ -466,6 +474,50 @@ class TestGSlidesToFull:
         assert result.rich.small_caps is True
         assert result.rich.baseline_offset == BaselineOffset.SUBSCRIPT
 
+    def test_equivalent_styles_share_result_within_cache(self):
+        """Equal TextStyles converted with one cache dict share a FullTextStyle."""
+        cache = {}
+        first = gslides_style_to_full(TextStyle(bold=True, fontFamily="Arial"), cache)
+        second = gslides_style_to_full(TextStyle(bold=True, fontFamily="Arial"), cache)
+        assert first is second
+
+    def test_results_without_cache_are_independent(self):
+        """Mutating one result must not leak into later conversions."""
+        red = OptionalColor(opaqueColor=Color(rgbColor=RgbColor(red=1.0, green=0.0, blue=0.0)))
+        first = gslides_style_to_full(TextStyle(fontFamily="Arial", foregroundColor=red))
+        first.markdown.bold = True
+        first.rich.font_size_pt = 99
+        first.rich.foreground_color.green = 1.0
+        second = gslides_style_to_full(TextStyle(fontFamily="Arial", foregroundColor=red))
+        assert second is not first
+        assert second.markdown.bold is False
+        assert second.rich.font_size_pt is None
+        assert second.rich.foreground_color.green == 0.0
+
+    def test_markdown_only_differences_share_rich_style(self):
+        """Styles differing only in markdown properties should share one RichStyle."""
+        cache = {}
+        plain = gslides_style_to_full(TextStyle(fontFamily="Georgia"), cache)
+        bold = gslides_style_to_full(TextStyle(fontFamily="Georgia", bold=True), cache)
+        assert plain is not bold
+        assert plain.rich is bold.rich
+
+    def test_different_styles_not_conflated(self):
+        """Styles differing in any converted field should get distinct results."""
+        red = TextStyle(
+            foregroundColor=OptionalColor(
+                opaqueColor=Color(rgbColor=RgbColor(red=1.0, green=0.0, blue=0.0))
+            )
+        )
+        theme = TextStyle(
+            foregroundColor=OptionalColor(opaqueColor=Color(themeColor=ThemeColorType.DARK1))
+        )
+        red_result = gslides_style_to_full(red)
+        theme_result = gslides_style_to_full(theme)
+        assert red_result is not theme_result
+        assert red_result.rich.foreground_color.red == 1.0
+        assert theme_result.rich.foreground_color.theme_color == "DARK1"
+
 
 class TestGSlidesToRich:
     """Tests for gslides_style_to_rich - should only extract RichStyle."""
@@ -658,6 +710,17 @@ class TestRichStyleToGSlides:
         assert result.italic is None
         assert result.strikethrough is None
 
+    def test_default_styles_keep_fields_set(self):
+        """Default styles should set every field explicitly, as the full path does."""
+        bold = rich_style_to_gslides(RichStyle(), MarkdownRenderableStyle(bold=True))
+        for markdown in (None, MarkdownRenderableStyle()):
+            result = rich_style_to_gslides(RichStyle(), markdown)
+            assert result == TextStyle()
+            assert result.model_fields_set == bold.model_fields_set
+            assert not result.is_default()
+            result.bold = True
+            assert rich_style_to_gslides(RichStyle(), markdown).bold is None
+
 
 class TestFullStyleToGSlides:
     """Tests for full_style_to_gslides conversion."""
@@ -723,6 +786,16 @@ class TestMarkdownStyleToGSlides:
         assert result.smallCaps is None
         assert result.weightedFontFamily is None
 
+    def test_empty_markdown_gives_fresh_style(self):
+        """Plain markdown should give a fresh all-None TextStyle with its fields set."""
+        first = markdown_style_to_gslides(MarkdownRenderableStyle())
+        assert first == TextStyle()
+        assert first.model_fields_set == {"bold", "italic", "strikethrough", "fontFamily", "link"}
+        assert not first.is_default()
+        first.bold = True
+        second = markdown_style_to_gslides(MarkdownRenderableStyle())
+        assert second.bold is None
+
 
 class TestRoundTrip:
     """Tests for round-trip conversion: GSlides -> Abstract -> GSlides."""
@@ -58,6 +58,17 @@ class TestAbstractColor:
         color3 = AbstractColor(red=0.0, green=0.0, blue=1.0)
         assert color3.to_hex() == "#0000ff"
 
+    def test_to_hex_all_channel_values(self):
+        """Every 0-255 channel value formats as two lowercase hex digits."""
+        for value in range(256):
+            color = AbstractColor.from_rgb_tuple((value, 0, 255 - value))
+            assert color.to_hex() == f"#{value:02x}00{255 - value:02x}"
+
+    def test_to_hex_out_of_range(self):
+        """Out-of-range channels must not index outside the hex lookup table."""
+        for red in (-0.1, 1.5):
+            AbstractColor(red=red).to_hex()  # must not raise IndexError
+
     def test_roundtrip_rgb_tuple(self):
         """Should roundtrip through RGB tuple conversion."""
         original = (128, 64, 192)
@@ -397,6 +408,31 @@ class TestStyleUniqueness:
         # Should be TWO unique styles
         assert len(styles) == 2
 
+    def test_value_key_matches_equality(self):
+        """Equal styles share a value_key; any differing field changes it."""
+        style = RichStyle(
+            font_family="Arial",
+            foreground_color=AbstractColor(red=1.0),
+            underline=True,
+        )
+        same = RichStyle(
+            font_family="Arial",
+            foreground_color=AbstractColor(red=1.0),
+            underline=True,
+        )
+        assert style.value_key() == same.value_key()
+        hash(style.value_key())
+
+        for changed in (
+            style.model_copy(update={"underline": False}),
+            style.model_copy(update={"foreground_color": AbstractColor(theme_color="DARK1")}),
+            style.model_copy(update={"baseline_offset": BaselineOffset.SUPERSCRIPT}),
+            style.model_copy(update={"double_strike": True}),
+            style.model_copy(update={"underline": False, "small_caps": True}),
+        ):
+            assert changed != style
+            assert changed.value_key() != style.value_key()
+
 
 class TestSpacingValue:
     """Tests for SpacingValue class."""
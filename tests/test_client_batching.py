@@ -331,7 +331,7 @@ class TestGoogleAPIClientInitialization:
 
         assert client.is_initialized is True
 
-    @patch('gslides_api.client.build')
+    @patch('gslides_api.client._build_service')
     def test_is_initialized_after_set_credentials(self, mock_build):
         """Test that is_initialized returns True after set_credentials is called."""
         client = GoogleAPIClient()
@@ -354,9 +354,68 @@ class TestGoogleAPIClientInitialization:
         # Should be True after setting credentials
         assert client.is_initialized is True
 
-        # Verify all services were built
-        assert mock_build.call_count == 3
+        # Services are built lazily, on first access
+        assert mock_build.call_count == 0
         assert client.crdtls == mock_credentials
+        assert client.sheet_service == mock_sheet_service
+        assert client.slide_service == mock_slide_service
+        assert client.drive_service == mock_drive_service
+        assert mock_build.call_count == 3
         assert client.sht_srvc == mock_sheet_service
         assert client.sld_srvc == mock_slide_service
         assert client.drive_srvc == mock_drive_service
+
+    @patch('gslides_api.client._build_service')
+    def test_set_credentials_builds_only_used_services(self, mock_build):
+        """Test that only the services actually accessed are built, and only once."""
+        client = GoogleAPIClient()
+        mock_build.return_value = Mock()
+        client.set_credentials(Mock(spec=Credentials))
+
+        client.slide_service
+        client.slide_service
+
+        assert mock_build.call_count == 1
+        assert mock_build.call_args.args[:2] == ("slides", "v1")
+        assert client.sht_srvc is None
+        assert client.drive_srvc is None
+
+    @patch('gslides_api.client._build_service')
+    def test_child_client_shares_lazily_built_services(self, mock_build):
+        """Test that a child client reuses services built through its parent."""
+        parent = GoogleAPIClient()
+        mock_build.return_value = Mock()
+        parent.set_credentials(Mock(spec=Credentials))
+
+        child = parent.create_child_client()
+        assert child.is_initialized is True
+        assert child.slide_service is parent.slide_service
+        assert mock_build.call_count == 1
+
+    def test_services_build_from_bundled_discovery_docs(self):
+        """Test that services are built offline from the bundled discovery documents."""
+        client = GoogleAPIClient()
+        client.set_credentials(Mock(spec=Credentials))
+
+        with patch("gslides_api.client.build") as mock_build:
+            for service in (client.sheet_service, client.slide_service, client.drive_service):
+                assert service is not None
+        mock_build.assert_not_called()
+
+    def test_service_access_without_credentials_raises(self):
+        """Test that accessing a service before set_credentials raises."""
+        client = GoogleAPIClient()
+        with pytest.raises(RuntimeError):
+            client.slide_service
+
+    @patch('gslides_api.client._build_service')
+    @patch('gslides_api.client.Credentials.from_authorized_user_file')
+    def test_initialize_credentials_parses_token_once(self, mock_from_file, mock_build, tmp_path):
+        """Test that an unchanged token.json is only parsed once per process."""
+        (tmp_path / "token.json").write_text("{}")
+        mock_from_file.return_value = Mock(spec=Credentials, valid=True)
+
+        GoogleAPIClient().initialize_credentials(str(tmp_path))
+        GoogleAPIClient().initialize_credentials(str(tmp_path))
+
+        assert mock_from_file.call_count == 1
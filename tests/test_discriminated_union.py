@@ -124,3 +124,24 @@ def test_discriminated_union_validation_error():
 
     # Check that the error is related to discriminator
     assert "discriminator" in str(exc_info.value).lower() or "tag" in str(exc_info.value).lower()
+
+
+def test_discriminated_union_accepts_instances():
+    """Test that already-built element instances pass through the union unchanged."""
+    page_element_adapter = TypeAdapter(PageElement)
+
+    table_element = TableElement(
+        objectId="table_1",
+        size=Size(width=100, height=100),
+        transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+        table=Table(rows=3, columns=4),
+    )
+    video_element = VideoElement(
+        objectId="video_1",
+        size=Size(width=100, height=100),
+        transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+        video=Video(source=VideoSourceType.YOUTUBE, id="dQw4w9WgXcQ"),
+    )
+
+    assert page_element_adapter.validate_python(table_element) is table_element
+    assert page_element_adapter.validate_python(video_element) is video_element
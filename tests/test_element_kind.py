@@ -1,6 +1,9 @@
 import pytest
 
+from gslides_api.domain.domain import Image, Transform
 from gslides_api.element.base import ElementKind
+from gslides_api.element.image import ImageElement
+from gslides_api.element.table import TableElement
 
 
 def test_element_kind_enum():
@@ -19,3 +22,19 @@ def test_element_kind_enum():
     # Check that we can convert from string to enum
     assert ElementKind("shape") == ElementKind.SHAPE
     assert ElementKind("table") == ElementKind.TABLE
+
+
+def test_element_type_is_fixed_per_class():
+    """Test that each element class reports its kind, whatever the input says."""
+    assert ImageElement.type == ElementKind.IMAGE
+    assert TableElement.type == ElementKind.TABLE
+
+    element = ImageElement(
+        objectId="image_1",
+        transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+        image=Image(contentUrl="https://example.com/image.jpg"),
+        type=ElementKind.SHAPE,
+    )
+    assert element.type == ElementKind.IMAGE
+    assert "type" not in ImageElement.model_fields
+    assert "type" not in element.model_dump()
@@ -256,6 +256,21 @@ class TestTableElementConversion:
         assert len(table_data.rows) == 1
         assert table_data.rows[0] == ["Cell 1", "Cell 2"]
 
+    def test_extract_table_data_pads_and_trims_rows(self):
+        """Test that data rows are padded or trimmed to the number of headers."""
+        table_elem = TableElement(
+            objectId="table_123",
+            table=Table(rows=3, columns=3, tableRows=[{"tableCells": []}]),
+            transform=Transform(scaleX=1.0, scaleY=1.0, translateX=0.0, translateY=0.0, unit="EMU"),
+        )
+        cell_text = [[" A ", "B"], ["short "], ["x", "y", "extra"]]
+
+        with patch.object(TableElement, "_read_text", return_value=cell_text):
+            table_data = table_elem.extract_table_data()
+
+        assert table_data.headers == ["A", "B"]
+        assert table_data.rows == [["short", ""], ["x", "y"]]
+
     def test_table_element_metadata_preservation(self):
         """Test that TableElement metadata is preserved during conversion."""
 
@@ -8,7 +8,12 @@ import requests
 from gslides_api.domain.domain import Image, Transform
 from gslides_api.agnostic.domain import ImageData
 from gslides_api.element.base import ElementKind
-from gslides_api.element.image import ImageElement
+from gslides_api.element.image import (
+    ImageElement,
+    _http_session,
+    get_images_data,
+    replace_images,
+)
 
 
 def test_image_data_creation():
@@ -93,7 +98,7 @@ def test_image_data_get_extension():
     assert image_data.get_extension() == ".bin"
 
 
-@patch("gslides_api.element.image.requests.get")
+@patch("gslides_api.element.image._http_session.get")
 def test_image_element_get_image_data(mock_get):
     """Test ImageElement.get_image_data method."""
     # Mock the HTTP response
@@ -121,7 +126,7 @@ def test_image_element_get_image_data(mock_get):
     mock_get.assert_called_once_with("https://example.com/image.jpg", timeout=30)
 
 
-@patch("gslides_api.element.image.requests.get")
+@patch("gslides_api.element.image._http_session.get")
 def test_image_element_get_image_data_fallback_to_source_url(mock_get):
     """Test ImageElement.get_image_data falls back to sourceUrl."""
     # Mock the HTTP response
@@ -161,7 +166,7 @@ def test_image_element_get_image_data_no_url():
         element.get_image_data()
 
 
-@patch("gslides_api.element.image.requests.get")
+@patch("gslides_api.element.image._http_session.get")
 def test_image_element_get_image_data_http_error(mock_get):
     """Test ImageElement.get_image_data handles HTTP errors."""
     # Mock HTTP error
@@ -178,7 +183,7 @@ def test_image_element_get_image_data_http_error(mock_get):
         element.get_image_data()
 
 
-@patch("gslides_api.element.image.requests.get")
+@patch("gslides_api.element.image._http_session.get")
 def test_image_element_get_image_data_empty_content(mock_get):
     """Test ImageElement.get_image_data handles empty content."""
     # Mock empty response
@@ -199,7 +204,7 @@ def test_image_element_get_image_data_empty_content(mock_get):
         element.get_image_data()
 
 
-@patch("gslides_api.element.image.requests.get")
+@patch("gslides_api.element.image._http_session.get")
 def test_image_element_get_image_data_mime_type_fallback(mock_get):
     """Test ImageElement.get_image_data MIME type detection from URL."""
     # Mock response with generic content type
@@ -221,3 +226,89 @@ def test_image_element_get_image_data_mime_type_fallback(mock_get):
 
     # Should have guessed PNG from URL
     assert image_data.mime_type == "image/png"
+
+
+def test_image_downloads_share_a_retrying_session():
+    """Test image downloads go through one pooled session that retries transient errors."""
+    adapter = _http_session.get_adapter("https://lh3.googleusercontent.com/image")
+    assert adapter is _http_session.get_adapter("http://example.com/image.png")
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+@patch("gslides_api.element.image._http_session.get")
+def test_get_images_data_keeps_order(mock_get):
+    """Test downloading several images returns their data in the input order."""
+
+    def fake_get(url, timeout):
+        response = Mock()
+        response.content = url.encode()
+        response.headers = {"content-type": "image/png"}
+        response.raise_for_status.return_value = None
+        return response
+
+    mock_get.side_effect = fake_get
+    transform = Transform(translateX=0, translateY=0, scaleX=1, scaleY=1)
+    elements = [
+        ImageElement(
+            objectId=f"image-{i}",
+            image=Image(contentUrl=f"https://example.com/{i}.png"),
+            transform=transform,
+        )
+        for i in range(5)
+    ]
+
+    images_data = get_images_data(elements, max_workers=3)
+
+    assert [d.content for d in images_data] == [
+        f"https://example.com/{i}.png".encode() for i in range(5)
+    ]
+    assert mock_get.call_count == 5
+    assert get_images_data([]) == []
+
+
+@patch("gslides_api.element.image.default_api_client")
+def test_replace_image_from_id_uses_default_client(mock_client):
+    """Test replacing an image without passing a client falls back to the default one."""
+    mock_client.batch_update.return_value = {"replies": [{}]}
+
+    out = ImageElement.replace_image_from_id(
+        "image-id", "presentation-id", url="https://example.com/new.png"
+    )
+
+    assert out == {"replies": [{}]}
+    requests, presentation_id = mock_client.batch_update.call_args.args
+    assert presentation_id == "presentation-id"
+    assert requests[0].imageObjectId == "image-id"
+
+
+def test_replace_images_sends_one_batch():
+    """Test replacing several images builds one batch update with a request per image."""
+    client = Mock()
+    client.batch_update.return_value = {"replies": [{}, {}]}
+
+    out = replace_images(
+        {"image-1": "https://example.com/1.png", "image-2": "https://example.com/2.png"},
+        "presentation-id",
+        api_client=client,
+    )
+
+    assert out == {"replies": [{}, {}]}
+    client.batch_update.assert_called_once()
+    requests, presentation_id = client.batch_update.call_args.args
+    assert presentation_id == "presentation-id"
+    assert [(r.imageObjectId, r.url) for r in requests] == [
+        ("image-1", "https://example.com/1.png"),
+        ("image-2", "https://example.com/2.png"),
+    ]
+    assert replace_images({}, "presentation-id", api_client=client) == {}
+    client.batch_update.assert_called_once()
+
+
+def test_replace_images_rejects_invalid_url():
+    """Test replacing images validates every URL before calling the API."""
+    client = Mock()
+
+    with pytest.raises(ValueError, match="http:// or https://"):
+        replace_images({"image-1": "ftp://example.com/1.png"}, "presentation-id", api_client=client)
+    client.batch_update.assert_not_called()
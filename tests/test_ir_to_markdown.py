@@ -13,7 +13,7 @@ from gslides_api.agnostic.ir_to_markdown import (
     ir_to_markdown,
     _consolidate_runs,
     _format_run_to_markdown,
-    _same_markdown_style,
+    _markdown_style_key,
 )
 from gslides_api.agnostic.text import (
     FullTextStyle,
@@ -139,38 +139,38 @@ class TestConsolidateRuns:
         assert result[0].content == "Hello World"
 
 
-class TestSameMarkdownStyle:
-    """Tests for markdown style comparison."""
+class TestMarkdownStyleKey:
+    """Tests for the markdown style comparison key."""
 
     def test_both_empty(self):
         """Empty styles should be equal."""
         a = MarkdownRenderableStyle()
         b = MarkdownRenderableStyle()
-        assert _same_markdown_style(a, b) is True
+        assert _markdown_style_key(a) == _markdown_style_key(b)
 
     def test_both_bold(self):
         """Both bold should be equal."""
         a = MarkdownRenderableStyle(bold=True)
         b = MarkdownRenderableStyle(bold=True)
-        assert _same_markdown_style(a, b) is True
+        assert _markdown_style_key(a) == _markdown_style_key(b)
 
     def test_bold_vs_not_bold(self):
         """Bold vs not bold should be different."""
         a = MarkdownRenderableStyle(bold=True)
         b = MarkdownRenderableStyle(bold=False)
-        assert _same_markdown_style(a, b) is False
+        assert _markdown_style_key(a) != _markdown_style_key(b)
 
     def test_bold_vs_italic(self):
         """Bold vs italic should be different."""
         a = MarkdownRenderableStyle(bold=True)
         b = MarkdownRenderableStyle(italic=True)
-        assert _same_markdown_style(a, b) is False
+        assert _markdown_style_key(a) != _markdown_style_key(b)
 
     def test_bold_and_italic(self):
         """Both bold+italic should be equal."""
         a = MarkdownRenderableStyle(bold=True, italic=True)
         b = MarkdownRenderableStyle(bold=True, italic=True)
-        assert _same_markdown_style(a, b) is True
+        assert _markdown_style_key(a) == _markdown_style_key(b)
 
 
 class TestFormatRunToMarkdown:
@@ -206,6 +206,14 @@ class TestFormatRunToMarkdown:
         result = _format_run_to_markdown("Hello", style)
         assert result == "~~Hello~~"
 
+    def test_bold_strikethrough_nesting(self):
+        """Strikethrough markers should sit inside bold markers."""
+        style = FullTextStyle(
+            markdown=MarkdownRenderableStyle(bold=True, italic=True, strikethrough=True)
+        )
+        result = _format_run_to_markdown("Hello", style)
+        assert result == "***~~Hello~~***"
+
     def test_hyperlink(self):
         """Hyperlink should use markdown link format."""
         style = FullTextStyle(
@@ -310,6 +318,12 @@ class TestFormatRunToMarkdown:
         result = _format_run_to_markdown("code\n", style)
         assert result == "`code`\n"
 
+    def test_trailing_space_before_newline_outside_markers(self):
+        """Spaces before a trailing newline should stay outside the markers."""
+        style = FullTextStyle(markdown=MarkdownRenderableStyle(bold=True))
+        result = _format_run_to_markdown("Hello \n", style)
+        assert result == "**Hello** \n"
+
 
 class TestIrToMarkdown:
     """Tests for full IR to markdown conversion."""
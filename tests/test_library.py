@@ -1,5 +1,7 @@
 """Tests for SlideLayoutLibrary.slide_from_markdown functionality."""
 
+import json
+
 import pytest
 
 from gslides_api.agnostic.element import ContentType
@@ -256,3 +258,106 @@ Content Slide Title"""
         assert result.elements[1].name == "Content"
         assert result.elements[1].content_type == ContentType.ANY
         assert result.elements[1].content is None
+
+
+class TestLibraryMapping:
+    """Tests for the dict-like name lookup on SlideLayoutLibrary."""
+
+    def test_getitem_by_name(self, library):
+        for slide in example_slides:
+            assert library[slide.name] is slide
+
+    def test_getitem_missing_raises(self, library):
+        with pytest.raises(KeyError):
+            library["No such slide"]
+
+    def test_setitem_replaces_and_appends(self, library):
+        replacement = MarkdownSlide(name="Title", elements=[])
+        library["Title"] = replacement
+        assert library["Title"] is replacement
+        assert library.slides[0] is replacement
+
+        new_slide = MarkdownSlide(name="Brand new", elements=[])
+        library["Brand new"] = new_slide
+        assert library["Brand new"] is new_slide
+        assert library.slides[-1] is new_slide
+
+    def test_lookup_survives_direct_list_mutation(self, library):
+        removed = library.slides.pop(0)
+        assert library["Section header"] is library.slides[0]
+        with pytest.raises(KeyError):
+            library[removed.name]
+
+    def test_lookup_after_in_place_replace(self):
+        library = SlideLayoutLibrary(slides=[s.model_copy() for s in example_slides])
+        library.slides[1] = library.slides[1].model_copy(update={"name": "Renamed"})
+        assert library["Renamed"] is library.slides[1]
+        with pytest.raises(KeyError):
+            library["Section header"]
+
+    def test_lookup_after_rename(self):
+        library = SlideLayoutLibrary(slides=[s.model_copy() for s in example_slides])
+        library.slides[0].name = "NewTitle"
+        assert library["NewTitle"] is library.slides[0]
+        with pytest.raises(KeyError):
+            library["Title"]
+
+    def test_setitem_indexes_by_slide_name(self, library):
+        renamed = MarkdownSlide(name="X", elements=[])
+        library["Title"] = renamed
+        assert library["X"] is renamed
+        assert library.slides[0] is renamed
+
+        appended = MarkdownSlide(name="Y", elements=[])
+        library["Not a slide name"] = appended
+        assert library["Y"] is appended
+
+    def test_slide_from_markdown_finds_renamed_slide(self):
+        library = SlideLayoutLibrary(slides=[s.model_copy() for s in example_slides])
+        library.slides[3].name = "Renamed content"
+        markdown = """<!-- slide: Renamed content -->
+<!-- text: Title -->
+Just a title"""
+        result = library.slide_from_markdown(markdown)
+        # Matched by name, not by the type fallback (which would pick "Title")
+        assert result.name == "Renamed content"
+        assert [el.name for el in result.elements] == ["Title", "Content"]
+
+
+class TestInstructions:
+    """Tests for SlideLayoutLibrary.instructions."""
+
+    def test_instructions_end_with_json_list_of_slides(self, library):
+        expected = json.dumps([slide.to_markdown() for slide in example_slides])
+        assert library.instructions().endswith(expected)
+
+    def test_instructions_empty_library(self):
+        assert SlideLayoutLibrary(slides=[]).instructions().endswith("[]")
+
+    def test_instructions_reflect_in_place_edits(self):
+        library = SlideLayoutLibrary(slides=[s.model_copy(deep=True) for s in example_slides])
+        first = library.instructions()
+
+        library["Title"].name = "Renamed title"
+        library["Renamed title"].elements[1].name = "Renamed subtitle"
+        second = library.instructions()
+        assert second != first
+        assert "Renamed title" in second
+        assert "Renamed subtitle" in second
+
+        library.slides.pop()
+        assert "Comparison" not in library.instructions()
+
+    def test_equality_ignores_caches(self):
+        a = SlideLayoutLibrary(slides=example_slides)
+        b = SlideLayoutLibrary(slides=example_slides)
+        assert a == b
+
+        a.instructions()
+        a["Title"]
+        with pytest.raises(KeyError):
+            a["No such slide"]
+        assert a == b
+
+        b["Extra"] = MarkdownSlide(name="Extra", elements=[])
+        assert a != b
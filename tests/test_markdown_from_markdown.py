@@ -30,3 +30,14 @@ class TestMarkdownToTextElements:
 
         # Verify the TextElement has proper indices
         assert element.insertionIndex == 0, f"Expected startIndex 0, got {element.startIndex}"
+
+    def test_repeated_markdown_gives_independent_requests(self):
+        """Converting the same markdown twice yields equal but independent requests."""
+        markdown = "# Title\n\nSome **bold** text\n\n* one\n* two\n"
+        first = markdown_to_text_elements(markdown)
+        second = markdown_to_text_elements(markdown)
+
+        assert [r.to_request() for r in first] == [r.to_request() for r in second]
+        first[0].objectId = "changed"
+        assert second[0].objectId != "changed"
+        assert all(a is not b for a, b in zip(first, second))
@@ -1,3 +1,5 @@
+from unittest.mock import Mock
+
 import pytest
 from pydantic import TypeAdapter
 
@@ -19,7 +21,7 @@ from gslides_api.domain.domain import (
     VideoProperties,
     WordArt,
 )
-from gslides_api.element.base import AltText, PageElementBase
+from gslides_api.element.base import AltText, PageElementBase, create_copies, update_elements
 from gslides_api.domain.table import Table
 from gslides_api.element.element import (
     GroupElement,
@@ -266,6 +268,24 @@ def test_absolute_size_with_float_values():
     assert abs(height_cm - 2.777777777777778) < 0.001
 
 
+def test_absolute_size_unit_values():
+    """Test absolute_size accepts OutputUnit values and converts to every unit."""
+    element = ShapeElement(
+        objectId="test_id",
+        size=Size(width=914400, height=360000),
+        transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+        shape=Shape(shapeType=Type.RECTANGLE, shapeProperties=ShapeProperties()),
+    )
+
+    assert (
+        element.absolute_size("in")
+        == element.absolute_size(OutputUnit.IN)
+        == (1.0, 360000 / 914400)
+    )
+    assert element.absolute_size(OutputUnit.PT) == (72.0, 360000 / 12700)
+    assert element.absolute_size(OutputUnit.EMU) == (914400, 360000)
+
+
 def test_absolute_size_invalid_units():
     """Test absolute_size method with invalid units."""
     element = ShapeElement(
@@ -565,3 +585,107 @@ def test_absolute_position_returns_x_y_order():
     # x should be horizontal (translateX), y should be vertical (translateY)
     assert abs(x - 1.0) < 0.001  # translateX=914400 EMU = 1 inch
     assert abs(y - 2.0) < 0.001  # translateY=1828800 EMU = 2 inches
+
+
+def test_element_properties_track_geometry_changes():
+    """element_properties reflects size/transform changes made after an earlier call."""
+    element = ShapeElement(
+        objectId="shape_id",
+        size=Size(width=100, height=100),
+        transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+        shape=Shape(shapeType=Type.RECTANGLE, shapeProperties=ShapeProperties()),
+    )
+
+    first = element.element_properties("page_id")
+    element.transform.translateX = 500
+    element.size = Size(width=Dimension(magnitude=10, unit="PT"), height=100)
+    second = element.element_properties("page_id")
+
+    assert first.transform.translateX == 0
+    assert first.size.width == 100
+    assert second.transform.translateX == 500
+    assert second.size.width.magnitude == 10
+    # Each call returns independent models
+    assert second.transform is not element.transform
+    assert element.element_properties("page_id") is not second
+
+
+def test_update_elements_sends_one_batch():
+    """update_elements collects every element's requests into a single batch_update call."""
+    elements = [
+        ShapeElement(
+            objectId=f"shape_{i}",
+            size=Size(width=100, height=100),
+            transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+            title=f"Title {i}",
+            shape=Shape(shapeType=Type.RECTANGLE, shapeProperties=ShapeProperties()),
+        )
+        for i in range(3)
+    ]
+    client = Mock()
+    client.batch_update.return_value = {"replies": []}
+
+    out = update_elements(elements, "pres_id", element_ids=["a", None, "c"], api_client=client)
+
+    assert out == {"replies": []}
+    client.batch_update.assert_called_once()
+    requests, presentation_id = client.batch_update.call_args.args
+    assert presentation_id == "pres_id"
+    assert [r.objectId for r in requests] == ["a", "shape_1", "c"]
+
+
+def test_update_elements_without_requests_skips_api_call():
+    """update_elements makes no API call when no element has anything to update."""
+    element = ShapeElement(
+        objectId="shape_id",
+        size=Size(width=100, height=100),
+        transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+        shape=Shape(shapeType=Type.RECTANGLE, shapeProperties=ShapeProperties()),
+    )
+    client = Mock()
+
+    assert update_elements([element], "pres_id", api_client=client) == {}
+    client.batch_update.assert_not_called()
+
+
+def test_create_copies_sends_one_batch():
+    """create_copies creates every element in one batch_update and maps the replies back."""
+    elements = [
+        ShapeElement(
+            objectId=f"shape_{i}",
+            size=Size(width=100, height=100),
+            transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+            shape=Shape(shapeType=Type.RECTANGLE, shapeProperties=ShapeProperties()),
+        )
+        for i in range(2)
+    ]
+    client = Mock()
+    client.batch_update.return_value = {
+        "replies": [{"createShape": {"objectId": "new_0"}}, {"createShape": {"objectId": "new_1"}}]
+    }
+
+    new_ids = create_copies(elements, "page_id", "pres_id", api_client=client)
+
+    assert new_ids == ["new_0", "new_1"]
+    client.batch_update.assert_called_once()
+    requests, presentation_id = client.batch_update.call_args.args
+    assert presentation_id == "pres_id"
+    assert len(requests) == 2
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [{}, {"replies": []}, {"replies": [{}]}, {"replies": [{"createShape": {}}]}],
+)
+def test_create_copy_without_reply_returns_none(reply):
+    """create_copy returns None when the batch update reply carries no object id."""
+    element = ShapeElement(
+        objectId="shape_id",
+        size=Size(width=100, height=100),
+        transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+        shape=Shape(shapeType=Type.RECTANGLE, shapeProperties=ShapeProperties()),
+    )
+    client = Mock()
+    client.batch_update.return_value = reply
+
+    assert element.create_copy("page_id", "pres_id", api_client=client) is None
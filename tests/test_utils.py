@@ -0,0 +1,44 @@
+"""Tests for gslides_api.utils helpers."""
+
+from gslides_api.utils import (
+    content_object_id,
+    dict_to_dot_separated_field_list,
+    dict_to_field_mask,
+)
+
+
+class TestFieldMask:
+    def test_nested_fields_are_dot_separated(self):
+        props = {
+            "outline": {"weight": {"magnitude": 1, "unit": "PT"}, "dashStyle": "SOLID"},
+            "transparency": 0.5,
+        }
+        assert dict_to_dot_separated_field_list(props) == [
+            "outline.weight.magnitude",
+            "outline.weight.unit",
+            "outline.dashStyle",
+            "transparency",
+        ]
+        assert dict_to_field_mask(props) == (
+            "outline.weight.magnitude,outline.weight.unit,outline.dashStyle,transparency"
+        )
+
+    def test_empty_nested_dict_contributes_no_fields(self):
+        assert dict_to_field_mask({"outline": {}, "link": "x"}) == "link"
+        assert dict_to_field_mask({}) == ""
+
+
+class TestContentObjectId:
+    def test_same_content_gives_same_id(self):
+        assert content_object_id("image", "![alt](https://x.png)") == content_object_id(
+            "image", "![alt](https://x.png)"
+        )
+
+    def test_id_format(self):
+        object_id = content_object_id("shape", "Hello")
+        assert object_id.startswith("shape_")
+        assert len(object_id) == len("shape_") + 8
+        assert content_object_id("shape", "Hello") != content_object_id("shape", "World")
+
+    def test_empty_content(self):
+        assert content_object_id("shape", None) == content_object_id("shape", "")
@@ -1,6 +1,14 @@
 import pytest
 
-from gslides_api.domain.domain import Outline, Video, VideoProperties, VideoSourceType
+from gslides_api.domain.domain import (
+    Outline,
+    Size,
+    Transform,
+    Video,
+    VideoProperties,
+    VideoSourceType,
+)
+from gslides_api.element.element import VideoElement
 
 
 def test_video_properties_creation():
@@ -60,3 +68,27 @@ def test_video_to_api_format():
     assert api_format["videoProperties"]["start"] == 10
     assert api_format["videoProperties"]["end"] == 60
     assert api_format["videoProperties"]["mute"] is True
+
+
+def test_video_element_update_request():
+    """Test the video properties update request carries the properties and their field mask."""
+    props = VideoProperties(autoPlay=True, start=10, mute=True)
+    element = VideoElement(
+        objectId="video_1",
+        size=Size(width=100, height=100),
+        transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+        video=Video(source=VideoSourceType.YOUTUBE, id="dQw4w9WgXcQ", videoProperties=props),
+    )
+
+    (request,) = element.element_to_update_request("target_id")
+
+    assert request.videoProperties == props
+    assert request.to_request() == [
+        {
+            "updateVideoProperties": {
+                "objectId": "target_id",
+                "videoProperties": {"autoPlay": True, "start": 10, "mute": True},
+                "fields": "autoPlay,start,mute",
+            }
+        }
+    ]